@@ -10,6 +10,8 @@ from pathlib import Path
 import pickle
 import json
 import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -18,6 +20,17 @@ from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.core.credentials import AzureKeyCredential
 from openai import AzureOpenAI
 
+# HTTP transport (ships with the openai SDK)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Connection pool size for the shared OpenAI client. Form filling fans
+# questions out over worker threads; keeping at least this many warm
+# keep-alive connections avoids a TLS handshake per concurrent request.
+HTTP_POOL_SIZE = 32
+
 # Vector search
 import faiss
 import numpy as np
@@ -75,6 +88,11 @@ class SimpleRAGChatbot:
         self.chunks = []
         self.metadata = []
         self.embedding_dim = None
+
+        # Query embedding cache (thread-safe; warmed by prefetchers)
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_max = 2048
+        self._embedding_cache_lock = threading.Lock()
         
         # Conversation memory
         self.enable_memory = enable_memory and ENHANCEMENTS_AVAILABLE
@@ -111,12 +129,25 @@ class SimpleRAGChatbot:
             if not endpoint or not key or not api_version:
                 raise ValueError("Azure OpenAI credentials not found in .env")
             
-            self.openai_client = AzureOpenAI(
-                api_key=key,
-                api_version=api_version,
-                azure_endpoint=endpoint
-            )
-        
+            client_kwargs = {
+                'api_key': key,
+                'api_version': api_version,
+                'azure_endpoint': endpoint,
+            }
+
+            # One shared client with a keep-alive pool sized for the
+            # worker-thread fan-out, so parallel asks reuse connections
+            # instead of thrashing TLS handshakes
+            if httpx is not None:
+                client_kwargs['http_client'] = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=HTTP_POOL_SIZE,
+                        max_keepalive_connections=HTTP_POOL_SIZE,
+                    )
+                )
+
+            self.openai_client = AzureOpenAI(**client_kwargs)
+
         return self.openai_client
     
     # ========================================================================
@@ -305,26 +336,56 @@ class SimpleRAGChatbot:
         
         return chunks_with_pages
     
+    def _cache_embedding(self, text: str, embedding: "np.ndarray"):
+        """Store one embedding in the query cache (evicting the oldest)"""
+        with self._embedding_cache_lock:
+            self._embedding_cache[text] = embedding
+            if len(self._embedding_cache) > self._embedding_cache_max:
+                self._embedding_cache.popitem(last=False)
+
     def get_embedding(self, text: str) -> np.ndarray:
         """Get embedding vector for single text (used for queries)"""
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(text)
+            if cached is not None:
+                self._embedding_cache.move_to_end(text)
+                return cached
+
         client = self._get_openai_client()
         embedding_deployment = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT")
-        
+
         if not embedding_deployment:
             raise ValueError("AZURE_OPENAI_EMBEDDING_DEPLOYMENT not found in .env")
-        
+
         response = client.embeddings.create(
             model=embedding_deployment,
             input=text
         )
-        
+
         embedding_array = np.array(response.data[0].embedding, dtype=np.float32)
-        
+
         if self.embedding_dim is None:
             self.embedding_dim = len(embedding_array)
             print(f"✓ Detected embedding dimension: {self.embedding_dim}")
-        
+
+        self._cache_embedding(text, embedding_array)
+
         return embedding_array
+
+    def warm_embedding_cache(self, texts: List[str]):
+        """Embed uncached texts in one batched API call and cache them
+
+        Lets callers prefetch upcoming queries (e.g. next page's
+        questions) so the later get_embedding calls are cache hits.
+        """
+        with self._embedding_cache_lock:
+            missing = [t for t in texts if t and t not in self._embedding_cache]
+
+        if not missing:
+            return
+
+        for text, embedding in zip(missing, self.get_embeddings_batch(missing)):
+            self._cache_embedding(text, embedding)
     
     def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
         """OPTIMIZED: Generate embeddings for multiple texts in one API call"""
@@ -639,8 +700,15 @@ class SimpleRAGChatbot:
         
         print(f"\n✓ Index saved to {self.index_path}/")
     
-    def load_index(self):
-        """Load FAISS index, metadata, and document tracker from disk"""
+    def load_index(self, mmap: bool = False):
+        """
+        Load FAISS index, metadata, and document tracker from disk
+
+        Args:
+            mmap: Memory-map the index read-only instead of loading it
+                  into RAM (demand-paged; for read-only consumers like
+                  retrievers - an mmap'd index cannot be appended to)
+        """
         index_file = os.path.join(self.index_path, "faiss.index")
         chunks_file = os.path.join(self.index_path, "chunks.pkl")
         metadata_file = os.path.join(self.index_path, "metadata.json")
@@ -654,8 +722,17 @@ class SimpleRAGChatbot:
                 config = json.load(f)
                 self.embedding_dim = config['embedding_dim']
         
-        self.faiss_index = faiss.read_index(index_file)
-        
+        if mmap:
+            try:
+                self.faiss_index = faiss.read_index(
+                    index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            except Exception as e:
+                print(f"⚠ mmap load not supported for this index type ({e}), loading into RAM")
+                self.faiss_index = faiss.read_index(index_file)
+        else:
+            self.faiss_index = faiss.read_index(index_file)
+
         with open(chunks_file, 'rb') as f:
             self.chunks = pickle.load(f)
         
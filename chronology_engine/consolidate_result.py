@@ -21,9 +21,13 @@ from datetime import datetime
 from typing import List, Dict
 
 
-def consolidate_json(input_pattern: str, output_file: str, pass_number: int, 
-                     input_dir: str = None, output_dir: str = None) -> bool:
-    """Consolidate multiple year JSON files into one"""
+def consolidate_json(input_pattern: str, output_file: str, pass_number: int,
+                     input_dir: str = None, output_dir: str = None):
+    """Consolidate multiple year JSON files into one
+
+    Returns the consolidated dict on success (so callers can reuse the
+    in-memory events, e.g. for CSV export) or None on failure.
+    """
 
     if input_dir is None:
         input_dir = config.OUTPUT_DIR
@@ -35,7 +39,7 @@ def consolidate_json(input_pattern: str, output_file: str, pass_number: int,
 
     if not input_files:
         print(f"✗ No files found matching: {input_pattern} in {input_dir}")
-        return False
+        return None
 
     print(f"\n{'='*70}")
     print(f"  CONSOLIDATING PASS {pass_number} FILES")
@@ -69,7 +73,7 @@ def consolidate_json(input_pattern: str, output_file: str, pass_number: int,
 
     if not all_events:
         print(f"\n✗ No events found in any file")
-        return False
+        return None
 
     # Sort all events by date and time
     all_events_sorted = sorted(
@@ -109,11 +113,49 @@ def consolidate_json(input_pattern: str, output_file: str, pass_number: int,
     print(f"  Years: {', '.join(map(str, sorted(years_processed)))}")
     print(f"  By type: {dict(sorted(event_types.items()))}")
 
-    return True
+    return output
+
+
+def _event_to_csv_row(event: Dict, fieldnames: List[str]) -> Dict:
+    """Flatten a single event into a CSV row (sources → joined strings)"""
+    row = {}
+
+    # Copy all fields except sources
+    for field in fieldnames:
+        if field in ['source_documents', 'source_pages']:
+            continue
+        row[field] = event.get(field, '')
+
+    # Flatten sources
+    sources = event.get('sources', [])
+    if sources:
+        docs = []
+        pages = []
+        for source in sources:
+            if isinstance(source, dict):
+                docs.append(source.get('document', '') or source.get('source', ''))
+                source_pages = source.get('pages', [])
+                if isinstance(source_pages, list):
+                    pages.append(', '.join(map(str, source_pages)))
+                else:
+                    pages.append(str(source_pages))
+
+        row['source_documents'] = '; '.join(docs)
+        row['source_pages'] = '; '.join(pages)
+    else:
+        row['source_documents'] = ''
+        row['source_pages'] = ''
+
+    return row
+
 
+def json_to_csv_consolidated(json_file: str, csv_file: str = None, data: Dict = None) -> bool:
+    """Convert consolidated JSON to CSV
 
-def json_to_csv_consolidated(json_file: str, csv_file: str = None) -> bool:
-    """Convert consolidated JSON to CSV"""
+    Streams one row per event through csv.DictWriter instead of
+    materializing all rows first. If `data` is provided (the dict returned
+    by consolidate_json), the JSON file is not re-read from disk.
+    """
 
     if csv_file is None:
         csv_file = json_file.replace('.json', '.csv')
@@ -123,13 +165,14 @@ def json_to_csv_consolidated(json_file: str, csv_file: str = None) -> bool:
     print(f"{'='*70}")
     print(f"\nInput: {json_file}")
 
-    # Load JSON
-    try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"✗ Failed to load JSON: {e}")
-        return False
+    # Load JSON (skipped when the consolidated dict is passed in)
+    if data is None:
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"✗ Failed to load JSON: {e}")
+            return False
 
     events = data.get('events', [])
     if not events:
@@ -159,48 +202,18 @@ def json_to_csv_consolidated(json_file: str, csv_file: str = None) -> bool:
             'description', 'source_documents', 'source_pages'
         ]
 
-    # Flatten events
-    rows = []
-    for event in events:
-        row = {}
-
-        # Copy all fields except sources
-        for field in fieldnames:
-            if field in ['source_documents', 'source_pages']:
-                continue
-            row[field] = event.get(field, '')
-
-        # Flatten sources
-        sources = event.get('sources', [])
-        if sources:
-            docs = []
-            pages = []
-            for source in sources:
-                if isinstance(source, dict):
-                    docs.append(source.get('document', '') or source.get('source', ''))
-                    source_pages = source.get('pages', [])
-                    if isinstance(source_pages, list):
-                        pages.append(', '.join(map(str, source_pages)))
-                    else:
-                        pages.append(str(source_pages))
-
-            row['source_documents'] = '; '.join(docs)
-            row['source_pages'] = '; '.join(pages)
-        else:
-            row['source_documents'] = ''
-            row['source_pages'] = ''
-
-        rows.append(row)
-
-    # Write CSV
+    # Write CSV - stream one row per event, no intermediate rows list
     try:
+        row_count = 0
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(rows)
+            for event in events:
+                writer.writerow(_event_to_csv_row(event, fieldnames))
+                row_count += 1
 
         print(f"✓ CSV saved: {csv_file}")
-        print(f"  Rows: {len(rows)}")
+        print(f"  Rows: {row_count}")
         print(f"  Columns: {', '.join(fieldnames)}")
         return True
 
@@ -234,7 +247,7 @@ def run_consolidation(pass1=False, pass2=False,
 
     # Consolidate Pass 1
     if pass1:
-        json_success = consolidate_json(
+        consolidated = consolidate_json(
             input_pattern='pass1_*.json',
             output_file='combined_pass1.json',
             pass_number=1,
@@ -242,9 +255,10 @@ def run_consolidation(pass1=False, pass2=False,
             output_dir=output_dir
         )
 
-        if json_success:
+        if consolidated is not None:
             csv_success = json_to_csv_consolidated(
-                json_file=os.path.join(output_dir, 'combined_pass1.json')
+                json_file=os.path.join(output_dir, 'combined_pass1.json'),
+                data=consolidated
             )
             success = success and csv_success
         else:
@@ -252,7 +266,7 @@ def run_consolidation(pass1=False, pass2=False,
 
     # Consolidate Pass 2
     if pass2:
-        json_success = consolidate_json(
+        consolidated = consolidate_json(
             input_pattern='pass2_*.json',
             output_file='combined_pass2.json',
             pass_number=2,
@@ -260,9 +274,10 @@ def run_consolidation(pass1=False, pass2=False,
             output_dir=output_dir
         )
 
-        if json_success:
+        if consolidated is not None:
             csv_success = json_to_csv_consolidated(
-                json_file=os.path.join(output_dir, 'combined_pass2.json')
+                json_file=os.path.join(output_dir, 'combined_pass2.json'),
+                data=consolidated
             )
             success = success and csv_success
         else:
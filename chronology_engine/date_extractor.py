@@ -6,11 +6,19 @@ import re
 import json
 from typing import List, Dict, Set
 from collections import defaultdict
+from datetime import datetime
 import sys
 sys.path.append('..')
 from utils.date_utils import DateUtils
 import config
 
+# Checkpoint compression (with graceful fallback)
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 
 class DateExtractor:
     """Extract dates from knowledge base chunks using regex"""
@@ -177,19 +185,38 @@ class DateExtractor:
         return dict(dates_by_year)
 
     def save_dates_cache(self, filepath: str, dates_by_year: Dict):
-        """Save extracted dates to cache file"""
-        with open(filepath, 'w') as f:
-            json.dump({
-                'extracted_at': DateUtils().fix_ocr_errors(str(DateUtils)),
-                'total_dates': sum(len(dates) for dates in dates_by_year.values()),
-                'dates_by_year': dates_by_year
-            }, f, indent=2)
-        print(f"  ✓ Saved date cache to {filepath}")
+        """Save extracted dates to cache file (zstd-compressed when available)"""
+        payload = {
+            'extracted_at': datetime.now().isoformat(),
+            'total_dates': sum(len(dates) for dates in dates_by_year.values()),
+            'dates_by_year': dates_by_year
+        }
+
+        if ZSTD_AVAILABLE:
+            # JSON checkpoints are highly compressible (repeated keys,
+            # ISO dates); level 3 compresses faster than the disk writes
+            cctx = zstd.ZstdCompressor(level=3)
+            data = json.dumps(payload, indent=2).encode('utf-8')
+            with open(filepath + '.zst', 'wb') as f:
+                f.write(cctx.compress(data))
+            print(f"  ✓ Saved date cache to {filepath}.zst")
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(payload, f, indent=2)
+            print(f"  ✓ Saved date cache to {filepath}")
 
     @staticmethod
     def load_dates_cache(filepath: str) -> Dict[str, List[str]]:
-        """Load dates from cache file"""
+        """Load dates from cache file (compressed or plain)"""
         try:
+            if ZSTD_AVAILABLE:
+                try:
+                    with open(filepath + '.zst', 'rb') as f:
+                        raw = zstd.ZstdDecompressor().decompress(f.read())
+                    return json.loads(raw).get('dates_by_year', {})
+                except FileNotFoundError:
+                    pass  # fall back to uncompressed cache
+
             with open(filepath, 'r') as f:
                 data = json.load(f)
                 return data.get('dates_by_year', {})
@@ -7,6 +7,7 @@ import json
 import pickle
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 import config
 from chronology_engine.date_extractor import DateExtractor
@@ -274,34 +275,57 @@ class WindowedPass1Extractor:
         print("="*70)
         
         all_results = {}
-        
-        for year in sorted(dates_by_year.keys()):
-            dates = dates_by_year[year]
-            print(f"\n[Year {year}]")
-            print(f"  Dates to process: {len(dates)}")
-            
-            year_events = []
-            
-            for date in dates:
-                windows = self.build_windows_for_date(date)
-                
-                if not windows:
-                    print(f"  [{date}] No windows found")
-                    continue
-                
-                date_events = []
-                for window in windows:
-                    events = self.extract_events_from_window(window)
-                    date_events.extend(events)
-                
-                print(f"  [{date}] {len(windows)} windows → {len(date_events)} events")
-                year_events.extend(date_events)
-            
-            all_results[int(year)] = year_events
-        
+
+        # Years are independent (read-only access to chunks/metadata), so
+        # process them in parallel worker threads. Threads (not processes)
+        # because the per-year cost is dominated by LLM calls and the
+        # OpenAI client / loaded KB can be shared without pickling.
+        max_workers = min(len(dates_by_year) or 1, getattr(config, 'MAX_WORKERS', 5))
+
+        if max_workers <= 1:
+            for year in sorted(dates_by_year.keys()):
+                all_results[int(year)] = self._process_year(year, dates_by_year[year])
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._process_year, year, dates_by_year[year]): year
+                    for year in sorted(dates_by_year.keys())
+                }
+                for future in as_completed(futures):
+                    year = futures[future]
+                    try:
+                        all_results[int(year)] = future.result()
+                    except Exception as e:
+                        print(f"  ✗ Year {year} failed: {e}")
+                        all_results[int(year)] = []
+
         # Save results
         self._save_results(all_results)
         return all_results
+
+    def _process_year(self, year: str, dates: List[str]) -> List[Dict]:
+        """Process all dates for a single year (runs in a worker thread)"""
+        print(f"\n[Year {year}]")
+        print(f"  Dates to process: {len(dates)}")
+
+        year_events = []
+
+        for date in dates:
+            windows = self.build_windows_for_date(date)
+
+            if not windows:
+                print(f"  [{date}] No windows found")
+                continue
+
+            date_events = []
+            for window in windows:
+                events = self.extract_events_from_window(window)
+                date_events.extend(events)
+
+            print(f"  [{date}] {len(windows)} windows → {len(date_events)} events")
+            year_events.extend(date_events)
+
+        return year_events
     
     def _save_results(self, results: Dict[int, List[Dict]]):
         """Save extraction results"""
@@ -22,6 +22,14 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import config
 
+# Token counting (with graceful fallback)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    print("⚠ tiktoken not available - falling back to character-based token estimates")
+
 
 class Pass2Enricher:
     """Clean and merge Pass 1 events into final chronology"""
@@ -46,10 +54,58 @@ class Pass2Enricher:
         print(f"  ✓ Azure OpenAI client loaded")
         print(f"  Model: {self.model_name}")
         
+        # Tokenizer for batch packing (None = estimate by characters)
+        self.encoder = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self.encoder = tiktoken.encoding_for_model("gpt-4o")
+            except Exception:
+                self.encoder = None
+
         print(f"\n[Configuration]")
         print(f"  Merge same date/provider: {config.PASS2_MERGE_SAME_DATE_PROVIDER}")
         print(f"  Deduplicate: {config.PASS2_DEDUPLICATE}")
         print(f"  Time window: {config.PASS2_MERGE_TIME_WINDOW} minutes")
+        print(f"  Max batch tokens: {getattr(config, 'PASS2_MAX_BATCH_TOKENS', 8000)}")
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text (rough 4 chars/token estimate without tiktoken)"""
+        if self.encoder is not None:
+            return len(self.encoder.encode(text))
+        return len(text) // 4
+
+    def _pack_batches(self, events: List[Dict]):
+        """
+        Greedily pack events into batches bounded by token budget
+
+        Replaces fixed-size slicing so each LLM request stays under the
+        prompt budget instead of overflowing on long descriptions.
+        Yields lists of events.
+        """
+        max_tokens = getattr(config, 'PASS2_MAX_BATCH_TOKENS', 8000)
+        max_events = getattr(config, 'PASS2_MAX_BATCH_EVENTS', 20)
+
+        # Fixed prompt cost (system prompt + user template without events)
+        overhead = self._count_tokens(config.PASS2_SYSTEM_PROMPT) + \
+                   self._count_tokens(config.PASS2_USER_PROMPT.format(events_json=''))
+
+        batch = []
+        batch_tokens = overhead
+
+        for event in events:
+            event_tokens = self._count_tokens(json.dumps(event, ensure_ascii=False))
+
+            if batch and (batch_tokens + event_tokens > max_tokens or len(batch) >= max_events):
+                yield batch
+                batch = []
+                batch_tokens = overhead
+
+            # An oversized single event still goes out alone
+            batch.append(event)
+            batch_tokens += event_tokens
+
+        if batch:
+            yield batch
     
     def load_pass1_file(self, filepath: str) -> Dict:
         """Load Pass 1 JSON file"""
@@ -161,13 +217,11 @@ class Pass2Enricher:
             print(f"  ⚠ No events to process")
             return False
         
-        # Process in batches (to avoid token limits)
-        batch_size = 20
+        # Process in token-bounded batches (to avoid token limits)
         all_enriched = []
-        
-        for i in range(0, len(events), batch_size):
-            batch = events[i:i+batch_size]
-            print(f"  → Processing batch {i//batch_size + 1} ({len(batch)} events)...", end='', flush=True)
+
+        for batch_num, batch in enumerate(self._pack_batches(events), 1):
+            print(f"  → Processing batch {batch_num} ({len(batch)} events)...", end='', flush=True)
             
             enriched_batch = self.enrich_batch(batch)
             
@@ -196,10 +250,13 @@ class Pass2Enricher:
             'events': all_enriched
         }
         
-        # Save Pass 2 file
+        # Save Pass 2 file (atomic: write .tmp then rename, so a crash
+        # mid-write never leaves a truncated checkpoint behind)
         output_file = input_path.parent / input_path.name.replace('pass1_', 'pass2_')
-        with open(output_file, 'w', encoding='utf-8') as f:
+        tmp_file = output_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, output_file)
         
         print(f"\n  ✓ Saved: {output_file}")
         print(f"    Final events: {len(all_enriched)} (merged from {len(events)})")
@@ -14,7 +14,11 @@ Usage:
 
 import os
 import sys
+import json
+import shutil
 import argparse
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -35,6 +39,18 @@ def print_step(step: int, total: int, text: str):
     print(f"\n[Step {step}/{total}] {text}")
     print("-"*70)
 
+def pass2_output_is_valid(output_file: Path) -> bool:
+    """Check whether a Pass 2 file exists and looks complete (resume check)"""
+    if not output_file.exists():
+        return False
+
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get('pass') == 2 and bool(data.get('events'))
+    except Exception:
+        return False
+
 def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
     """
     Run the complete chronology generation pipeline
@@ -74,7 +90,6 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
 
     except Exception as e:
         print(f"\n✗ Pass 1 failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -103,6 +118,12 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
             print(f"  Enriching {i}/{len(pass1_files)}: {pass1_file.name}")
             print(f"{'='*70}")
 
+            # Resume support: skip years already enriched unless --rebuild
+            output_file = pass1_file.parent / pass1_file.name.replace('pass1_', 'pass2_')
+            if not rebuild and pass2_output_is_valid(output_file):
+                print(f"  ↷ Skipping (already enriched: {output_file.name}, use --rebuild to redo)")
+                continue
+
             success = enricher.process_file(str(pass1_file))
             if not success:
                 print(f"  ⚠ Warning: Failed to enrich {pass1_file.name}")
@@ -111,7 +132,6 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
 
     except Exception as e:
         print(f"\n✗ Pass 2 failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -131,18 +151,17 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
         # Temporarily change output dir for consolidation
         original_output_dir = config.OUTPUT_DIR
 
-        # Run consolidation for both Pass 1 and Pass 2
-        print(f"\n{'='*70}")
-        print(f"  Consolidating Pass 1 Results")
-        print(f"{'='*70}")
-
-        success_pass1 = run_consolidation(pass1=True, pass2=False)
-
+        # Run consolidation for both Pass 1 and Pass 2 in parallel -
+        # they read and write disjoint files
         print(f"\n{'='*70}")
-        print(f"  Consolidating Pass 2 Results")
+        print(f"  Consolidating Pass 1 + Pass 2 Results (parallel)")
         print(f"{'='*70}")
 
-        success_pass2 = run_consolidation(pass1=False, pass2=True)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_pass1 = executor.submit(run_consolidation, pass1=True, pass2=False)
+            future_pass2 = executor.submit(run_consolidation, pass1=False, pass2=True)
+            success_pass1 = future_pass1.result()
+            success_pass2 = future_pass2.result()
 
         if not (success_pass1 and success_pass2):
             print(f"\n⚠ Warning: Consolidation had some issues")
@@ -157,7 +176,6 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
             src = Path(config.OUTPUT_DIR) / filename
             if src.exists():
                 dst = result_dir / filename
-                import shutil
                 shutil.move(str(src), str(dst))
                 print(f"  ✓ Moved: {filename} → chronology_result/")
             else:
@@ -167,7 +185,6 @@ def run_full_pipeline(years=None, rebuild=False, kb_path='knowledge_base'):
 
     except Exception as e:
         print(f"\n✗ Consolidation failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -241,6 +258,5 @@ Examples:
 
     except Exception as e:
         print(f"\n✗ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
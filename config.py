@@ -19,6 +19,7 @@ ENABLE_PARALLEL = True               # Thread-based parallel processing
 
 MAX_WORKERS = 5                      # Number of parallel worker threads
 TIMEOUT_PER_QUESTION = 30            # Max seconds per question
+ENABLE_REQUEST_COALESCING = False    # Batch concurrent LLM calls via BatchingChatbot
 
 # ════════════════════════════════════════════════════════════════════════════
 # 🔍 RAG PARAMETERS (Balanced mode - matching chatbot config)
@@ -80,6 +81,7 @@ LOW_CONFIDENCE_THRESHOLD = 0.50      # Below 50% = flag for review
 # Context System Configuration
 ENABLE_CONTEXT_INJECTION = True  # Enable section-level context for dependent questions
 CONTEXT_MAX_TOKENS = 2000        # Maximum tokens for context string (safety limit)
+CONTEXT_TOP_K = 8                # Max prior answers injected for synthesis questions
 
 
 
@@ -137,6 +139,14 @@ OCR_CORRECTIONS = {
     'Decemebr': 'December',
 }
 
+# Single alternation regex so all corrections apply in one scan
+import re
+_OCR_RE = re.compile('|'.join(re.escape(k) for k in OCR_CORRECTIONS))
+
+def fix_ocr(text: str) -> str:
+    """Apply all OCR_CORRECTIONS in a single pass over text"""
+    return _OCR_RE.sub(lambda m: OCR_CORRECTIONS[m.group(0)], text)
+
 # ============================================
 # PASS 1: MINIMAL EXTRACTION SETTINGS
 # ============================================
@@ -297,6 +307,10 @@ PASS2_MERGE_SAME_DATE_PROVIDER = True  # Merge events with same date+provider+fa
 PASS2_MERGE_TIME_WINDOW = 60           # Minutes - events within this window may be merged
 PASS2_DEDUPLICATE = True                # Remove exact duplicates
 
+# Batch packing settings (token-aware, counted with tiktoken)
+PASS2_MAX_BATCH_TOKENS = 8000          # Prompt budget per enrichment request
+PASS2_MAX_BATCH_EVENTS = 20            # Hard cap on events per batch
+
 # CSV Export - Choose which fields to include
 CSV_EXPORT_FIELDS = [
     'date',
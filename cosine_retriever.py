@@ -12,9 +12,51 @@ Usage:
 """
 
 import os
+import faiss
+import threading
 import numpy as np
-from typing import List, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict
 from advance_rag_memory import SimpleRAGChatbot
+from enhancements._simd_norm import normalize_rows_inplace, normalize_vec, topk_cosine
+
+# Below this many rows the BLAS matvec wins over the fused Numba kernel
+FUSED_TOPK_MIN_ROWS = 4096
+
+
+def _partial_topk(similarities: np.ndarray, topk: int) -> np.ndarray:
+    """
+    Indices of the topk largest similarities, sorted descending
+
+    O(N) argpartition selection plus an O(k log k) sort of the keepers,
+    instead of argsorting all N values.
+    """
+    if topk >= len(similarities):
+        return np.argsort(-similarities)
+
+    part = np.argpartition(similarities, -topk)[-topk:]
+    return part[np.argsort(-similarities[part])]
+
+
+def _aligned_empty(shape, dtype=np.float32, alignment=64):
+    """
+    Allocate a C-contiguous array whose data pointer is alignment-byte
+    aligned (64 bytes = cache line / unmasked AVX-512 load width), by
+    over-allocating and slicing to the first aligned element.
+    """
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape))
+    buf = np.empty(size + alignment // dtype.itemsize, dtype=dtype)
+    offset = (-buf.ctypes.data % alignment) // dtype.itemsize
+    return buf[offset:offset + size].reshape(shape)
+
+# Optional SIMD similarity kernels (with graceful fallback)
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
 
 
 class CosineRetriever:
@@ -25,50 +67,192 @@ class CosineRetriever:
     similarity manually at query time.
     """
     
-    def __init__(self, kb_path: str = "knowledge_base"):
+    def __init__(self, kb_path: str = "knowledge_base", verbose: bool = True):
         """
         Initialize cosine retriever
-        
+
         Args:
             kb_path: Path to knowledge base folder
+            verbose: Print the startup summary line (default: True; pass
+                     False in benchmarks/tests that construct repeatedly)
         """
-        print(f"\n[Cosine Retriever Initialization]")
-        print(f"  Loading knowledge base from: {kb_path}")
-        
+        self.verbose = verbose
+
         # Load the underlying RAG chatbot
         self.chatbot = SimpleRAGChatbot(kb_path)
-        
-        if not self.chatbot.load_index():
+
+        # Read-only consumer: mmap the index so startup doesn't pull the
+        # whole file into RAM (hot pages are demand-paged by the OS)
+        if not self.chatbot.load_index(mmap=True):
             raise ValueError(f"Failed to load FAISS index from {kb_path}")
-        
-        print(f"  ✓ FAISS index loaded: {self.chatbot.faiss_index.ntotal} vectors")
-        print(f"  ✓ Using COSINE similarity (computed at query time)")
-        
+
         # Precompute normalized embeddings for all chunks
-        print(f"  → Precomputing normalized embeddings...")
         self._precompute_normalized_embeddings()
-        print(f"  ✓ Normalized {len(self.normalized_embeddings)} chunk embeddings")
+
+        if self.verbose:
+            # One structured line instead of a stack of per-step prints
+            print(f"[CosineRetriever] kb={kb_path} "
+                  f"vectors={self.chatbot.faiss_index.ntotal} "
+                  f"normalized={len(self.normalized_embeddings)} metric=cosine")
+
+        # Query embedding cache: repeated queries (date strings recur
+        # constantly) skip the embedding API round-trip entirely
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_max = 1024
+        # retrieve_stream hits the cache from a prefetch thread
+        self._embedding_cache_lock = threading.Lock()
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Get query embedding, served from the LRU cache on repeats"""
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(query)
+            if cached is not None:
+                self._embedding_cache.move_to_end(query)
+                return cached
+
+        embedding = self.chatbot.get_embedding(query)
+
+        with self._embedding_cache_lock:
+            self._embedding_cache[query] = embedding
+            if len(self._embedding_cache) > self._embedding_cache_max:
+                self._embedding_cache.popitem(last=False)  # evict oldest
+        return embedding
+
+    def warmup(self, queries: List[str]):
+        """Preload embeddings for expected queries in one batched API call"""
+        with self._embedding_cache_lock:
+            missing = [q for q in queries if q not in self._embedding_cache]
+        if not missing:
+            return
+
+        embeddings = self.chatbot.get_embeddings_batch(missing)
+
+        with self._embedding_cache_lock:
+            for query, embedding in zip(missing, embeddings):
+                self._embedding_cache[query] = embedding
+            while len(self._embedding_cache) > self._embedding_cache_max:
+                self._embedding_cache.popitem(last=False)
     
+    def _load_persisted_matrix(self, filename: str, ntotal: int):
+        """
+        mmap a matrix persisted by dumps/build_normalized.py, or None
+
+        A stale file (row count no longer matching the index) is ignored
+        so an out-of-date cache can never serve wrong vectors.
+        """
+        path = os.path.join(self.chatbot.index_path, filename)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            arr = np.load(path, mmap_mode='r')
+        except Exception as e:
+            print(f"  ⚠ Could not load {filename}: {e}")
+            return None
+
+        if arr.shape[0] != ntotal:
+            print(f"  ⚠ {filename} is stale ({arr.shape[0]} rows vs {ntotal} in index), ignoring")
+            return None
+
+        return arr
+
     def _precompute_normalized_embeddings(self):
         """Precompute and store normalized embeddings for all chunks"""
-        self.normalized_embeddings = []
-        
-        for i in range(self.chatbot.faiss_index.ntotal):
-            # Extract embedding from FAISS index
-            embedding = self.chatbot.faiss_index.reconstruct(int(i))
-            
-            # Normalize to unit length
-            norm = np.linalg.norm(embedding)
-            if norm > 0:
-                normalized = embedding / norm
-            else:
-                normalized = embedding
-            
-            self.normalized_embeddings.append(normalized)
-        
-        # Convert to numpy array for faster computation
-        self.normalized_embeddings = np.array(self.normalized_embeddings)
+        ntotal = self.chatbot.faiss_index.ntotal
+
+        # Fast path: matrix pre-normalized at build time and persisted
+        # (dumps/build_normalized.py) - mmap it, skip reconstruction
+        arr = self._load_persisted_matrix('embeddings_f32.npy', ntotal)
+
+        if arr is None:
+            # Pull all vectors in one reconstruct_n call (contiguous (N,d)
+            # float32) instead of N per-row reconstruct() round-trips
+            arr = self.chatbot.faiss_index.reconstruct_n(0, ntotal)
+            arr = arr.astype(np.float32, copy=False)
+
+            # Normalize rows to unit length in-place (zero rows stay zero);
+            # multi-core SIMD kernel when numba is installed
+            normalize_rows_inplace(arr)
+
+            # Contiguous float32 matrix (what FAISS and BLAS kernels expect)
+            arr = np.ascontiguousarray(arr)
+
+            # Re-home to a 64-byte aligned buffer so SIMD kernels get
+            # aligned, non-split cache-line loads (.npy mmaps already
+            # align their data section, so only this path needs it)
+            if arr.size > 0 and arr.ctypes.data % 64 != 0:
+                aligned = _aligned_empty(arr.shape, dtype=arr.dtype)
+                np.copyto(aligned, arr)
+                arr = aligned
+
+        self.normalized_embeddings = arr
+
+        # Inner-product index over the normalized vectors: cosine top-k
+        # becomes a SIMD/BLAS search with a partial heap instead of a
+        # full np.dot + argsort per query
+        self.ip_index = None
+        if len(self.normalized_embeddings) > 0:
+            try:
+                self.ip_index = faiss.IndexFlatIP(self.normalized_embeddings.shape[1])
+                self.ip_index.add(self.normalized_embeddings)
+            except Exception as e:
+                print(f"  ⚠ Could not build IP index, falling back to NumPy search: {e}")
+                self.ip_index = None
+
+        # int8 copy for the SimSIMD scan path: rows are unit vectors, so
+        # a symmetric scale of 127 suffices, and the 4x smaller matrix
+        # moves 4x less memory per bandwidth-bound query. Only built when
+        # it's actually reachable, i.e. the IP index couldn't be built.
+        self.embeddings_i8 = None
+        if SIMSIMD_AVAILABLE and self.ip_index is None and len(self.normalized_embeddings) > 0:
+            self.embeddings_i8 = self._load_persisted_matrix('embeddings_i8.npy', ntotal)
+            if self.embeddings_i8 is None:
+                self.embeddings_i8 = np.clip(
+                    np.round(self.normalized_embeddings * 127.0), -128, 127
+                ).astype(np.int8)
     
+    def _cosine_similarities(self, query_normalized: np.ndarray) -> np.ndarray:
+        """
+        Similarity of the normalized query against all chunk vectors
+
+        Uses SimSIMD's AVX/NEON cosine kernel when installed - single
+        query vs many rows is where it beats the BLAS matvec - and falls
+        back to np.dot otherwise.
+        """
+        matrix = self.normalized_embeddings
+
+        if SIMSIMD_AVAILABLE and matrix.flags['C_CONTIGUOUS'] and matrix.dtype == np.float32:
+            q = np.ascontiguousarray(query_normalized, dtype=np.float32)
+            # cdist returns cosine *distance* (1 - similarity)
+            distances = np.asarray(simsimd.cdist(q[None, :], matrix, metric="cosine"))
+            return 1.0 - distances[0]
+
+        return np.dot(matrix, query_normalized)
+
+    def _search_i8(self, query_normalized: np.ndarray, topk: int):
+        """
+        Approximate int8 scan then exact float32 rerank
+
+        Scores all rows against the quantized query with SimSIMD's int8
+        cosine kernel, keeps the top 2*topk candidates, and rescores only
+        those in float32 so the returned similarities stay exact.
+        Returns (indices, similarities) sorted descending.
+        """
+        q_i8 = np.clip(np.round(query_normalized * 127.0), -128, 127).astype(np.int8)
+        distances = np.asarray(simsimd.cdist(q_i8[None, :], self.embeddings_i8, metric="cosine"))
+        approx = 1.0 - distances[0]
+
+        n = len(approx)
+        n_candidates = min(2 * topk, n)
+        if n_candidates >= n:
+            candidates = np.arange(n)
+        else:
+            candidates = np.argpartition(approx, -n_candidates)[-n_candidates:]
+
+        exact = np.dot(self.normalized_embeddings[candidates], query_normalized)
+        order = np.argsort(-exact)[:min(topk, n_candidates)]
+        return candidates[order], exact[order]
+
     def retrieve(self, query: str, topk: int = 10) -> List[Dict]:
         """
         Retrieve most similar chunks using cosine similarity
@@ -80,29 +264,56 @@ class CosineRetriever:
         Returns:
             List of dicts with keys: chunk, metadata, distance, similarity
         """
-        # Get query embedding
-        query_embedding = self.chatbot.get_embedding(query)
+        # Get query embedding (cached for repeated queries)
+        query_embedding = self._embed_query(query)
         
         # Normalize query embedding
-        query_norm = np.linalg.norm(query_embedding)
-        if query_norm > 0:
-            query_normalized = query_embedding / query_norm
+        query_normalized = normalize_vec(query_embedding)
+
+        return self.retrieve_vec(query_normalized, topk)
+
+    def retrieve_vec(self, query_normalized: np.ndarray, topk: int = 10) -> List[Dict]:
+        """
+        Retrieve using an already-normalized query vector
+
+        Workhorse behind retrieve(). Callers holding a precomputed
+        unit-length embedding (batched or cached paths) can call this
+        directly and skip the embed + normalize steps.
+        """
+        if self.ip_index is not None:
+            # FAISS inner-product search: BLAS-backed dot products plus a
+            # partial top-k heap, no full sort over all N similarities
+            q = np.ascontiguousarray(
+                query_normalized.reshape(1, -1), dtype=np.float32
+            )
+            k = min(topk, self.ip_index.ntotal)
+            sims, indices = self.ip_index.search(q, k)
+            scored = zip(indices[0], sims[0])
+        elif self.embeddings_i8 is not None:
+            # Quantized scan + exact rerank of the short list
+            top_indices, top_sims = self._search_i8(query_normalized, topk)
+            scored = zip(top_indices, top_sims)
+        elif topk_cosine is not None and len(self.normalized_embeddings) >= FUSED_TOPK_MIN_ROWS:
+            # Fused dot + top-k heap: one pass over the matrix with no
+            # length-N similarity vector allocated
+            q = np.ascontiguousarray(query_normalized, dtype=np.float32)
+            top_indices, top_sims = topk_cosine(self.normalized_embeddings, q, topk)
+            scored = zip(top_indices, top_sims)
         else:
-            query_normalized = query_embedding
-        
-        # Compute cosine similarity with all chunks
-        # Cosine similarity = dot product of normalized vectors
-        similarities = np.dot(self.normalized_embeddings, query_normalized)
-        
-        # Get top k indices (argsort returns ascending, so reverse)
-        top_indices = np.argsort(similarities)[::-1][:topk]
-        
-        # Build results
+            # Fallback: cosine similarity = dot product of normalized vectors
+            similarities = self._cosine_similarities(query_normalized)
+            top_indices = _partial_topk(similarities, topk)
+            scored = ((idx, similarities[idx]) for idx in top_indices)
+
+        return self._build_results(scored)
+
+    def _build_results(self, scored) -> List[Dict]:
+        """Build result dicts from (index, similarity) pairs"""
         results = []
-        for idx in top_indices:
-            similarity = float(similarities[idx])
+        for idx, similarity in scored:
+            similarity = float(similarity)
             distance = 1.0 - similarity  # Convert to distance for consistency
-            
+
             results.append({
                 'chunk': self.chatbot.chunks[idx],
                 'metadata': self.chatbot.metadata[idx],
@@ -110,9 +321,79 @@ class CosineRetriever:
                 'similarity': similarity,
                 'cosine_similarity': similarity  # Explicit field
             })
-        
+
         return results
+
+    def retrieve_batch(self, queries: List[str], topk: int = 10) -> List[List[Dict]]:
+        """
+        Retrieve for several queries at once
+
+        All missing embeddings are fetched in one API call, and the
+        similarity block is computed for every query together (one FAISS
+        batch search / level-3 BLAS matmul instead of a matvec per
+        query). Returns one result list per query, in order.
+        """
+        if not queries:
+            return []
+
+        # One embeddings API round-trip for everything not yet cached
+        self.warmup(queries)
+
+        q_mat = np.ascontiguousarray(
+            np.stack([self._embed_query(q) for q in queries]),
+            dtype=np.float32
+        )
+        normalize_rows_inplace(q_mat)
+
+        if self.ip_index is not None:
+            k = min(topk, self.ip_index.ntotal)
+            sims_block, idx_block = self.ip_index.search(q_mat, k)
+            return [
+                self._build_results(zip(idx_row, sim_row))
+                for idx_row, sim_row in zip(idx_block, sims_block)
+            ]
+
+        # Fallback: one sgemm for the whole block, partial top-k per row
+        sims = q_mat @ self.normalized_embeddings.T
+
+        batch_results = []
+        for similarities in sims:
+            top_indices = _partial_topk(similarities, topk)
+            batch_results.append(
+                self._build_results((idx, similarities[idx]) for idx in top_indices)
+            )
+
+        return batch_results
     
+    def retrieve_stream(self, queries: Iterable[str], topk: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield results for a sequence of queries, overlapping I/O and compute
+
+        While the similarity search for query i runs, the embedding
+        request for query i+1 is already in flight on a background
+        thread (landing in the embedding cache), hiding the network
+        latency behind the search. One prefetch is kept in flight at a
+        time to bound memory.
+        """
+        iterator = iter(queries)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                current = next(iterator)
+            except StopIteration:
+                return
+
+            future = executor.submit(self._embed_query, current)
+
+            for next_query in iterator:
+                future.result()  # current query's embedding is now cached
+                future = executor.submit(self._embed_query, next_query)
+                yield self.retrieve(current, topk)  # cache hit, no API call
+                current = next_query
+
+            future.result()
+            yield self.retrieve(current, topk)
+
     def _get_openai_client(self):
         """Get OpenAI client from underlying chatbot"""
         return self.chatbot._get_openai_client()
@@ -136,9 +417,11 @@ class HybridRetriever:
             method: "L2" or "COSINE"
         """
         self.method = method.upper()
-        
+
         if self.method == "COSINE":
             self.retriever = CosineRetriever(kb_path)
+            # CosineRetriever keeps chunks/metadata/client on its chatbot
+            self._delegate = self.retriever.chatbot
         else:
             # Use standard L2 retriever
             self.retriever = SimpleRAGChatbot(kb_path)
@@ -147,54 +430,24 @@ class HybridRetriever:
             print(f"\n[L2 Retriever]")
             print(f"  ✓ FAISS index loaded: {self.retriever.faiss_index.ntotal} vectors")
             print(f"  ✓ Using L2 distance (standard)")
-    
+            self._delegate = self.retriever
+
     def retrieve(self, query: str, topk: int = 10) -> List[Dict]:
         """Retrieve using configured method"""
         return self.retriever.retrieve(query, topk)
-    
-    def _get_openai_client(self):
-        """Get OpenAI client"""
-        if hasattr(self.retriever, '_get_openai_client'):
-            return self.retriever._get_openai_client()
-        elif hasattr(self.retriever, 'chatbot'):
-            return self.retriever.chatbot._get_openai_client()
-        else:
-            raise AttributeError("Cannot find OpenAI client")
-    
+
     def get_method(self) -> str:
         """Get current retrieval method"""
         return self.method
-    
-    # Expose underlying attributes as properties
-    @property
-    def chunks(self):
-        """Access chunks from underlying retriever"""
-        if hasattr(self.retriever, 'chunks'):
-            return self.retriever.chunks
-        elif hasattr(self.retriever, 'chatbot'):
-            return self.retriever.chatbot.chunks
-        else:
-            raise AttributeError("Chunks not available")
-    
-    @property
-    def metadata(self):
-        """Access metadata from underlying retriever"""
-        if hasattr(self.retriever, 'metadata'):
-            return self.retriever.metadata
-        elif hasattr(self.retriever, 'chatbot'):
-            return self.retriever.chatbot.metadata
-        else:
-            raise AttributeError("Metadata not available")
-    
-    @property
-    def faiss_index(self):
-        """Access FAISS index from underlying retriever"""
-        if hasattr(self.retriever, 'faiss_index'):
-            return self.retriever.faiss_index
-        elif hasattr(self.retriever, 'chatbot'):
-            return self.retriever.chatbot.faiss_index
-        else:
-            raise AttributeError("FAISS index not available")
+
+    def __getattr__(self, name):
+        """Delegate everything else (chunks, metadata, faiss_index,
+        _get_openai_client, ...) to the resolved underlying retriever"""
+        try:
+            delegate = self.__dict__['_delegate']
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(delegate, name)
 
 
 if __name__ == '__main__':
@@ -234,7 +487,7 @@ if __name__ == '__main__':
     print("\n" + "-"*70)
     print(" COSINE SIMILARITY")
     print("-"*70)
-    cosine_retriever = CosineRetriever("knowledge_base")
+    cosine_retriever = CosineRetriever("knowledge_base", verbose=False)
     cosine_results = cosine_retriever.retrieve(test_query, 5)
     
     print(f"\nTop 5 chunks (Cosine):")
@@ -0,0 +1,25 @@
+# Run this ONCE after (re)building the knowledge base to persist the
+# normalized embedding matrix, so retriever startup can mmap it instead
+# of reconstructing + normalizing every vector on every run
+import os
+
+import faiss
+import numpy as np
+
+KB_PATH = 'knowledge_base'
+
+# Reconstruct all vectors from the FAISS index in one call
+index = faiss.read_index(os.path.join(KB_PATH, 'faiss.index'))
+arr = index.reconstruct_n(0, index.ntotal).astype(np.float32, copy=False)
+
+# Normalize rows to unit length (zero rows stay zero)
+norms = np.linalg.norm(arr, axis=1, keepdims=True)
+np.divide(arr, norms, out=arr, where=norms > 0)
+
+# Persist float32 matrix + int8 quantized copy (symmetric scale 127)
+np.save(os.path.join(KB_PATH, 'embeddings_f32.npy'), np.ascontiguousarray(arr))
+np.save(os.path.join(KB_PATH, 'embeddings_i8.npy'),
+        np.clip(np.round(arr * 127.0), -128, 127).astype(np.int8))
+
+print("✓ Created embeddings_f32.npy and embeddings_i8.npy")
+print(f"✓ {arr.shape[0]} vectors, dimension {arr.shape[1]}")
@@ -0,0 +1,57 @@
+# Run this ONCE (and after any mapping change) to pre-bake the full
+# (section, question_id) -> pdf field table into generated_field_map.py.
+# Importing that module loads a single marshalled dict, so lookups skip
+# all mapper dispatch; form_filler_combined picks it up automatically
+# when present.
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Block any existing generated_field_map from importing: the
+# enumeration must come from the live tables/mappers only, never from a
+# stale copy of this script's own output
+sys.modules['generated_field_map'] = None
+
+from form_filler_combined import question_id_to_pdf_field
+
+SECTIONS = [
+    'CLAIM INFO',
+    'OVERVIEW AND TIMELINE OF KEY POINTS',
+    'DEGREE OF INJURY',
+    'PATIENT INTAKE/ASSESSMENT SECTION',
+    'PATIENT INTAKE/ASSESSMENT',
+    'DIAGNOSTIC WORK UP',
+    'TREATMENT',
+    'PROCEDURES/SURGERIES',
+    'MONITORING AND FOLLOWUP',
+    'ADDITIONAL CONTRIBUTING FACTORS',
+    'STANDARD OF CARE',
+    'CAUSATION',
+    'CLOSING THOUGHTS',
+]
+
+# Every question id shape the mappers understand
+MAIN_IDS = [str(n) for n in range(1, 16)] + ['2.alleged', '2.suffered']
+SUFFIXES = ['', '.1', '.1.1', '.2', '.2.1', '.2.2', '.2.3', '.2.4',
+            '.3', '.3.1', '.4', '.4.1', '.5', '.5.1', '.6', '.6.1']
+
+entries = {}
+for section in SECTIONS:
+    for main_id in MAIN_IDS:
+        for suffix in SUFFIXES:
+            question_id = main_id + suffix
+            field = question_id_to_pdf_field(question_id, section)
+            if field is not None:
+                entries[(section, question_id)] = field
+
+output_path = Path(__file__).resolve().parent.parent / 'generated_field_map.py'
+with open(output_path, 'w', encoding='utf-8') as f:
+    f.write('# Auto-generated by dumps/gen_field_map.py - do not edit\n')
+    f.write('FIELD_MAP = {\n')
+    for (section, question_id), field in sorted(entries.items()):
+        f.write(f'    ({section!r}, {question_id!r}): {field!r},\n')
+    f.write('}\n')
+
+print(f"✓ Created {output_path.name}")
+print(f"✓ {len(entries)} (section, question_id) entries")
@@ -4,40 +4,52 @@ import hashlib
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+# C-backed JSON parsing/serialization (with stdlib fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load existing metadata
-with open('knowledge_base/metadata.json', 'r') as f:
-    metadata = json.load(f)
+if orjson is not None:
+    with open('knowledge_base/metadata.json', 'rb') as f:
+        metadata = orjson.loads(f.read())
+else:
+    with open('knowledge_base/metadata.json', 'r') as f:
+        metadata = json.load(f)
 
-# Build tracker from metadata
+# Build tracker from metadata: find where the source changes with one
+# vectorized diff instead of walking every chunk in Python, then write
+# one tracker entry per document range
 tracker = {}
-current_source = None
-start_idx = 0
-
-for idx, meta in enumerate(metadata):
-    source = meta['source']
-    
-    if source != current_source:
-        # New document started
-        if current_source is not None:
-            # Finalize previous document
-            tracker[current_source]['vector_end_idx'] = idx - 1
-        
-        # Start new document tracking
-        tracker[source] = {
+
+sources = np.array([meta['source'] for meta in metadata])
+if len(sources) > 0:
+    boundaries = np.concatenate((
+        [0],
+        np.flatnonzero(sources[1:] != sources[:-1]) + 1,
+        [len(sources)]
+    ))
+    indexed_at = datetime.now().isoformat()
+
+    for start, end in zip(boundaries[:-1], boundaries[1:]):
+        tracker[str(sources[start])] = {
             'hash': 'unknown',  # Can't recreate hash without original file
-            'last_indexed': datetime.now().isoformat(),
-            'chunk_count': 0,
-            'vector_start_idx': idx,
-            'vector_end_idx': idx
+            'last_indexed': indexed_at,
+            'chunk_count': int(end - start),
+            'vector_start_idx': int(start),
+            'vector_end_idx': int(end - 1)
         }
-        current_source = source
-    
-    tracker[current_source]['chunk_count'] += 1
-    tracker[current_source]['vector_end_idx'] = idx
 
 # Save tracker
-with open('knowledge_base/document_tracker.json', 'w') as f:
-    json.dump(tracker, f, indent=2)
+if orjson is not None:
+    with open('knowledge_base/document_tracker.json', 'wb') as f:
+        f.write(orjson.dumps(tracker, option=orjson.OPT_INDENT_2))
+else:
+    with open('knowledge_base/document_tracker.json', 'w') as f:
+        json.dump(tracker, f, indent=2)
 
 print("✓ Created document_tracker.json")
 print(f"✓ Tracked {len(tracker)} documents")
\ No newline at end of file
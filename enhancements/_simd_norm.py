@@ -0,0 +1,121 @@
+"""
+SIMD row-normalization kernels for embedding matrices
+
+Numba-compiled (parallel + fastmath) when numba is installed, so the
+one-time normalization of a large (N, d) matrix uses every core with
+LLVM auto-vectorized inner loops. Falls back to equivalent NumPy ops.
+"""
+
+import math
+import numpy as np
+
+# Numba kernels (with graceful fallback)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def normalize_rows_inplace(a):
+        """Divide each row of a by its L2 norm, in place (zero rows kept)"""
+        for i in prange(a.shape[0]):
+            s = 0.0
+            for j in range(a.shape[1]):
+                s += a[i, j] * a[i, j]
+            if s > 0.0:
+                inv = 1.0 / math.sqrt(s)
+                for j in range(a.shape[1]):
+                    a[i, j] *= inv
+
+    @njit(fastmath=True, cache=True)
+    def normalize_vec(v):
+        """Return a unit-length copy of v (zero vector returned as-is)"""
+        s = 0.0
+        for j in range(v.shape[0]):
+            s += v[j] * v[j]
+        out = v.copy()
+        if s > 0.0:
+            inv = 1.0 / math.sqrt(s)
+            for j in range(v.shape[0]):
+                out[j] *= inv
+        return out
+
+    @njit(fastmath=True, cache=True)
+    def topk_cosine(matrix, q, k):
+        """
+        Fused dot-product + top-k over normalized rows
+
+        Streams each row once, keeping a k-sized min-heap of the best
+        scores, so no length-N similarity vector is ever materialized
+        and each row is read from memory exactly once.
+        Returns (indices, scores) sorted descending.
+        """
+        n = matrix.shape[0]
+        d = matrix.shape[1]
+        if k > n:
+            k = n
+
+        heap_scores = np.empty(k, dtype=np.float32)
+        heap_idx = np.empty(k, dtype=np.int64)
+        count = 0
+
+        for i in range(n):
+            s = 0.0
+            for j in range(d):
+                s += matrix[i, j] * q[j]
+
+            if count < k:
+                # Push and sift up
+                heap_scores[count] = s
+                heap_idx[count] = i
+                count += 1
+                c = count - 1
+                while c > 0:
+                    p = (c - 1) // 2
+                    if heap_scores[c] < heap_scores[p]:
+                        heap_scores[c], heap_scores[p] = heap_scores[p], heap_scores[c]
+                        heap_idx[c], heap_idx[p] = heap_idx[p], heap_idx[c]
+                        c = p
+                    else:
+                        break
+            elif s > heap_scores[0]:
+                # Replace root and sift down
+                heap_scores[0] = s
+                heap_idx[0] = i
+                c = 0
+                while True:
+                    left = 2 * c + 1
+                    right = left + 1
+                    smallest = c
+                    if left < k and heap_scores[left] < heap_scores[smallest]:
+                        smallest = left
+                    if right < k and heap_scores[right] < heap_scores[smallest]:
+                        smallest = right
+                    if smallest == c:
+                        break
+                    heap_scores[c], heap_scores[smallest] = heap_scores[smallest], heap_scores[c]
+                    heap_idx[c], heap_idx[smallest] = heap_idx[smallest], heap_idx[c]
+                    c = smallest
+
+        order = np.argsort(-heap_scores[:count])
+        return heap_idx[:count][order], heap_scores[:count][order]
+
+else:
+
+    def normalize_rows_inplace(a):
+        """Divide each row of a by its L2 norm, in place (zero rows kept)"""
+        norms = np.linalg.norm(a, axis=1, keepdims=True)
+        np.divide(a, norms, out=a, where=norms > 0)
+
+    def normalize_vec(v):
+        """Return a unit-length copy of v (zero vector returned as-is)"""
+        norm = np.linalg.norm(v)
+        if norm > 0:
+            return v / norm
+        return v
+
+    topk_cosine = None  # fused kernel needs numba; callers check for None
@@ -9,7 +9,10 @@ Features:
 - Thread-safe and easy to integrate
 """
 
-from typing import List, Dict, Optional
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Dict, Optional
 from datetime import datetime
 
 
@@ -21,16 +24,48 @@ class ConversationBufferMemory:
     When the window is full, oldest messages are automatically removed.
     """
     
-    def __init__(self, max_exchanges: int = 10):
+    def __init__(self, max_exchanges: int = 10, track_timestamps: bool = False):
         """
         Initialize conversation memory
-        
+
         Args:
             max_exchanges: Maximum number of Q&A pairs to store (default: 10)
                           This means 10 questions + 10 answers = 20 messages total
+            track_timestamps: Record a timestamp per message (default: False;
+                             most callers never render them, so skip the
+                             clock read and formatting per message)
         """
         self.max_exchanges = max_exchanges
-        self.messages: List[Dict] = []
+        self.track_timestamps = track_timestamps
+        # deque evicts from the head in O(1) (popleft), replacing the
+        # O(N) list.pop(0) window enforcement; eviction stays pair-wise
+        # so a lone add_user_message can't leave an orphaned assistant
+        # message at the head of the window
+        self.messages: Deque[Dict] = deque()
+
+        # Formatted-string cache, invalidated whenever messages mutate
+        self._format_cache: Dict[tuple, str] = {}
+        self._version = 0
+
+    def _invalidate_cache(self):
+        """Mark the conversation as changed (drops cached formats)"""
+        self._version += 1
+        self._format_cache.clear()
+
+    def _append(self, role: str, content: str):
+        """Append one message, timestamped only when tracking is enabled"""
+        message = {"role": role, "content": content}
+        if self.track_timestamps:
+            message["timestamp"] = time.time()  # formatted lazily on render
+        self.messages.append(message)
+
+        # Maintain sliding window: drop oldest Q&A pairs (2 messages at
+        # a time) until we're within limit
+        max_messages = self.max_exchanges * 2
+        while len(self.messages) > max_messages:
+            self.messages.popleft()
+            if self.messages:
+                self.messages.popleft()
         
     def add_exchange(self, user_message: str, assistant_message: str):
         """
@@ -41,23 +76,10 @@ class ConversationBufferMemory:
             user_message: User's question/input
             assistant_message: Assistant's response
         """
-        # Add user message
-        self.messages.append({
-            "role": "user",
-            "content": user_message,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Add assistant message
-        self.messages.append({
-            "role": "assistant",
-            "content": assistant_message,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Maintain sliding window
-        self._enforce_window_size()
-    
+        self._append("user", user_message)
+        self._append("assistant", assistant_message)
+        self._invalidate_cache()
+
     def add_user_message(self, message: str):
         """
         Add only user message (for cases where you add messages separately)
@@ -65,13 +87,9 @@ class ConversationBufferMemory:
         Args:
             message: User's message
         """
-        self.messages.append({
-            "role": "user",
-            "content": message,
-            "timestamp": datetime.now().isoformat()
-        })
-        self._enforce_window_size()
-    
+        self._append("user", message)
+        self._invalidate_cache()
+
     def add_assistant_message(self, message: str):
         """
         Add only assistant message (for cases where you add messages separately)
@@ -79,27 +97,10 @@ class ConversationBufferMemory:
         Args:
             message: Assistant's message
         """
-        self.messages.append({
-            "role": "assistant",
-            "content": message,
-            "timestamp": datetime.now().isoformat()
-        })
-        self._enforce_window_size()
-    
-    def _enforce_window_size(self):
-        """
-        Enforce sliding window: keep only last N exchanges (2N messages)
-        Removes oldest Q&A pairs when limit is exceeded
-        """
-        max_messages = self.max_exchanges * 2
-        
-        # Remove oldest pairs (2 messages at a time) until we're within limit
-        while len(self.messages) > max_messages:
-            self.messages.pop(0)  # Remove oldest user message
-            if len(self.messages) > 0:  # Safety check
-                self.messages.pop(0)  # Remove oldest assistant message
-    
-    def get_conversation_string(self, 
+        self._append("assistant", message)
+        self._invalidate_cache()
+
+    def get_conversation_string(self,
                                include_timestamps: bool = False,
                                user_prefix: str = "User",
                                assistant_prefix: str = "Assistant") -> str:
@@ -116,20 +117,30 @@ class ConversationBufferMemory:
         """
         if not self.messages:
             return ""
-        
+
+        # Memoized per conversation version + format params: called every
+        # LLM turn, so repeat calls on an unchanged window are O(1)
+        cache_key = (self._version, include_timestamps, user_prefix, assistant_prefix)
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         conversation_lines = []
-        
+
         for msg in self.messages:
             prefix = user_prefix if msg["role"] == "user" else assistant_prefix
-            
-            if include_timestamps:
-                line = f"[{msg['timestamp']}] {prefix}: {msg['content']}"
+
+            if include_timestamps and "timestamp" in msg:
+                timestamp = datetime.fromtimestamp(msg["timestamp"]).isoformat()
+                line = f"[{timestamp}] {prefix}: {msg['content']}"
             else:
                 line = f"{prefix}: {msg['content']}"
-            
+
             conversation_lines.append(line)
-        
-        return "\n".join(conversation_lines)
+
+        result = "\n".join(conversation_lines)
+        self._format_cache[cache_key] = result
+        return result
     
     def get_messages(self) -> List[Dict]:
         """
@@ -156,13 +167,14 @@ class ConversationBufferMemory:
         """
         messages_to_get = min(n * 2, len(self.messages))
         return [
-            {"role": msg["role"], "content": msg["content"]} 
-            for msg in self.messages[-messages_to_get:]
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in islice(self.messages, len(self.messages) - messages_to_get, None)
         ]
     
     def clear(self):
         """Clear all conversation history"""
-        self.messages = []
+        self.messages.clear()
+        self._invalidate_cache()
     
     def is_empty(self) -> bool:
         """Check if memory is empty"""
@@ -219,7 +231,7 @@ if __name__ == "__main__":
     print("="*70)
     
     # Create memory with 3 exchange limit (for testing)
-    memory = ConversationBufferMemory(max_exchanges=3)
+    memory = ConversationBufferMemory(max_exchanges=3, track_timestamps=True)
     
     print(f"\nInitial state: {memory}")
     print(f"Summary: {memory.get_summary()}\n")
@@ -3,6 +3,7 @@ Form Engine - RAG-based form filling modules
 """
 
 from .chatbot_adapter import ChatbotAdapter
+from .batching_chatbot import BatchingChatbot
 from .chunk_cache import ChunkCache
 from .question_processor import QuestionProcessor
 from .answer_formatter import AnswerFormatter
@@ -14,6 +15,7 @@ from .context_manager import ContextManager
 
 __all__ = [
     'ChatbotAdapter',
+    'BatchingChatbot',
     'ChunkCache',
     'QuestionProcessor',
     'AnswerFormatter',
@@ -3,8 +3,208 @@ answer_formatter.py - Format answers based on question type and requirements (OP
 """
 
 import re
+from functools import lru_cache
 from typing import Dict
 
+# Optional multi-string matcher (with graceful fallback)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Field-type keywords in priority order (first matching type wins,
+# mirroring the original elif chain)
+_FIELD_TYPE_KEYWORDS = [
+    ('phone', ('phone', 'contact', 'number')),
+    ('date', ('date', 'when', 'time')),
+    ('email', ('email', 'mail')),
+    ('name', ('name', 'defendant', 'plaintiff', 'attorney', 'reviewer')),
+    ('address', ('address', 'location', 'city', 'state', 'zip')),
+]
+
+# One Aho-Corasick automaton over all keywords: a single linear scan of
+# the question replaces five independent any(word in ...) passes
+_FIELD_AC = None
+if AHOCORASICK_AVAILABLE:
+    _FIELD_AC = ahocorasick.Automaton()
+    for _priority, (_ftype, _words) in enumerate(_FIELD_TYPE_KEYWORDS):
+        for _word in _words:
+            _FIELD_AC.add_word(_word, (_priority, _ftype))
+    _FIELD_AC.make_automaton()
+
+# Precompiled patterns - clean_answer and the rating parsers run once per
+# answer in the batch loop, so compile at import instead of per call
+_PHONE_RE = re.compile(r'(?:\+?1?\s*)?(?:\()?(\d{3})(?:\))?[-.\s]?(\d{3})[-.\s]?(\d{4}|\d+)|\b\d{7,10}\b')
+_DATE_RE = re.compile(
+    r'\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})\b',
+    re.IGNORECASE
+)
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# One anchored alternation: a single scan strips whichever name prefix
+# is present instead of five sequential sub passes. The bare "A:" case
+# stays case-sensitive via an inline look: uppercase letter only.
+_NAME_PREFIX_RE = re.compile(
+    r'^(?:(?:defendant|plaintiff|attorney|reviewer)\s+name\s*:\s*'
+    r'|The\s+defendants?\s+are\s*:\s*'
+    r'|Defendant\s+names?\s*:\s*'
+    r'|\d+\.\s+)',
+    re.IGNORECASE
+)
+_LETTER_PREFIX_RE = re.compile(r'^[A-Z]:\s*')
+def _strip_bullet(line: str) -> str:
+    """Strip one leading bullet char plus following spaces, no regex"""
+    stripped = line.strip()
+    if stripped[:1] in '-•*':
+        return stripped[1:].lstrip()
+    return stripped
+
+_THE_X_IS_RE = re.compile(r'^The\s+\w+\s+(?:is|are)\s+', re.IGNORECASE)
+_SOURCE_CITATION_RE = re.compile(r'\s*\[\s*(?:Source|Sources)\s*:.*?\]\s*', re.IGNORECASE | re.DOTALL)
+
+@lru_cache(maxsize=256)
+def _lower_options(options: tuple) -> tuple:
+    """Lowercased copy of an options tuple, cached per distinct list
+
+    The same response_options recur across every row of a batch, so the
+    per-option .lower() calls are paid once instead of per question.
+    """
+    return tuple(option.lower() for option in options)
+
+
+# Whitespace needing normalization: runs of 2+, or any single
+# whitespace char that isn't a plain space - [^\S ] covers tabs,
+# newlines AND Unicode spaces (\xa0,  , ...) so everything
+# ' '.join(split()) used to flatten still gets flattened
+_MULTIWS_RE = re.compile(r'\s{2,}|[^\S ]')
+
+@lru_cache(maxsize=2048)
+def _extract_option_cached(first_part: str, options: tuple) -> str:
+    """First option appearing in the (lowercased) answer head, cached
+
+    Retries and sub-question re-evaluation feed identical
+    (answer, options) pairs back through; hits skip the scan loop.
+    """
+    for option, option_lower in zip(options, _lower_options(options)):
+        if option_lower in first_part:
+            return option
+    return 'Not Found'
+
+
+@lru_cache(maxsize=256)
+def _options_automaton(options: tuple):
+    """Aho-Corasick automaton over the lowercased options, per options list
+
+    Returns None when pyahocorasick is missing or the option count is
+    small enough that K linear scans are cheaper than automaton setup.
+    """
+    if not AHOCORASICK_AVAILABLE or len(options) < 4:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for option, option_lower in zip(options, _lower_options(options)):
+        automaton.add_word(option_lower, option)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=2048)
+def _extract_multiple_cached(answer_lower: str, options: tuple) -> tuple:
+    """All options appearing in the lowercased answer, cached"""
+    automaton = _options_automaton(options)
+    if automaton is not None:
+        # One linear pass over the answer finds every option at once
+        matched = {option for _, option in automaton.iter(answer_lower)}
+        return tuple(option for option in options if option in matched)
+
+    return tuple(
+        option
+        for option, option_lower in zip(options, _lower_options(options))
+        if option_lower in answer_lower
+    )
+
+
+def _extract_phone(cleaned: str):
+    """Phone number from text, or None when absent"""
+    match = _PHONE_RE.search(cleaned)
+    return match.group(0).strip().replace(' ', '') if match else None
+
+
+def _extract_date(cleaned: str):
+    """Date substring from text, or None when absent"""
+    match = _DATE_RE.search(cleaned)
+    return match.group(0) if match else None
+
+
+def _extract_email(cleaned: str):
+    """Email address from text, or None when absent"""
+    match = _EMAIL_RE.search(cleaned)
+    return match.group(0) if match else None
+
+
+def _clean_name(cleaned: str) -> str:
+    """Strip name-label prefixes and per-line bullets"""
+    cleaned = _NAME_PREFIX_RE.sub('', cleaned)
+    cleaned = _LETTER_PREFIX_RE.sub('', cleaned)  # "A: " prefixes
+
+    # Keep multiline names but clean each line
+    lines = cleaned.split('\n')
+    return '\n'.join(_strip_bullet(line) for line in lines if line.strip())
+
+
+_ADDRESS_PREFIXES = ('address', 'location')
+
+
+def _clean_address(cleaned: str) -> str:
+    """Strip address label prefixes (literal words - no regex needed)"""
+    head = cleaned[:12].lower()
+    for prefix in _ADDRESS_PREFIXES:
+        if head.startswith(prefix):
+            rest = cleaned[len(prefix):].lstrip()
+            if rest[:1] == ':':
+                return rest[1:].lstrip()
+            break
+    return cleaned
+
+
+# Field-type dispatch tables: extractors return the final answer (or
+# None to fall through), cleaners transform and continue to the generic
+# cleanup. One dict lookup replaces the elif chain, and a compiled
+# implementation could be swapped in per entry.
+_FIELD_EXTRACTORS = {
+    'phone': _extract_phone,
+    'date': _extract_date,
+    'email': _extract_email,
+}
+_FIELD_CLEANERS = {
+    'name': _clean_name,
+    'address': _clean_address,
+}
+
+
+# Answers that mean "nothing found" (all <= 20 chars, so longer strings
+# skip the lowercase + lookup entirely)
+_NOT_FOUND_TOKENS = frozenset({'unknown', 'n/a', 'not available', 'not provided', ''})
+
+
+@lru_cache(maxsize=2048)
+def _format_answer_cached(answer_text, question_type, response_options, confidence,
+                          requires_explanation):
+    """Cached formatting for hashable (string answer, tuple options) inputs"""
+    return AnswerFormatter._format_answer_impl(
+        answer_text, question_type, response_options, confidence, requires_explanation
+    )
+
+# Common case ("RATING: n ... EXPLANATION: ...") in one search; the
+# explanation part is optional so a bare rating still matches
+_RATING_FULL_RE = re.compile(
+    r'RATING:\s*(?P<rating>\d+)(?:.*?EXPLANATION:\s*(?P<expl>.+))?',
+    re.IGNORECASE | re.DOTALL
+)
+_FALLBACK_DIGIT_RE = re.compile(r'\b([1-9])\b')
+_EXPLANATION_RE = re.compile(r'EXPLANATION:\s*(.+)', re.IGNORECASE | re.DOTALL)
+
 
 class AnswerFormatter:
     """
@@ -16,8 +216,17 @@ class AnswerFormatter:
         """
         Detect field type based on question text
         """
+        if not question_text:
+            return 'text'
+
         q_lower = question_text.lower()
-        
+
+        if _FIELD_AC is not None:
+            # One pass over the question; lowest priority (= earliest
+            # branch of the original chain) among all hits wins
+            best = min((payload for _, payload in _FIELD_AC.iter(q_lower)), default=None)
+            return best[1] if best else 'text'
+
         if any(word in q_lower for word in ['phone', 'contact', 'number']):
             return 'phone'
         elif any(word in q_lower for word in ['date', 'when', 'time']):
@@ -32,96 +241,96 @@ class AnswerFormatter:
             return 'text'
 
     @staticmethod
-    def clean_answer(answer_text: str, question_text: str = "") -> str:
+    def clean_answer(answer_text: str, question_text: str = "", field_type: str = None) -> str:
         """
         Smart cleaning based on detected field type
+
+        Callers that already know the field type (e.g. from the form
+        schema) can pass it directly and skip keyword detection.
         """
         if not answer_text or answer_text == "NOT_FOUND":
             return answer_text
-        
+
         cleaned = answer_text.strip()
-        
-        # Detect field type from question text
-        field_type = AnswerFormatter.detect_field_type(question_text)
-        
-        # FIELD-TYPE SPECIFIC EXTRACTION
-        if field_type == 'phone':
-            # Extract ONLY phone number
-            phone_pattern = r'(?:\+?1?\s*)?(?:\()?(\d{3})(?:\))?[-.\s]?(\d{3})[-.\s]?(\d{4}|\d+)|\b\d{7,10}\b'
-            match = re.search(phone_pattern, cleaned)
-            if match:
-                return match.group(0).strip().replace(' ', '')
-        
-        elif field_type == 'date':
-            # Extract date patterns
-            date_pattern = r'\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})\b'
-            match = re.search(date_pattern, cleaned, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        elif field_type == 'email':
-            # Extract email
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            match = re.search(email_pattern, cleaned)
-            if match:
-                return match.group(0)
-        
-        elif field_type == 'name':
-            # Remove various prefixes that might precede names
-            cleaned = re.sub(r'^(?:defendant|plaintiff|attorney|reviewer)\s+name\s*:\s*', '', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'^The\s+defendants?\s+are\s*:\s*', '', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'^Defendant\s+names?\s*:\s*', '', cleaned, flags=re.IGNORECASE)  # ✅ NEW
-            cleaned = re.sub(r'^[A-Z]:\s*', '', cleaned)  # ✅ NEW - removes "A: " prefixes
-            cleaned = re.sub(r'^\d+\.\s+', '', cleaned)  # Remove "1. " prefixes in lists
-            
-            # Keep multiline names but clean each line
-            lines = cleaned.split('\n')
-            lines = [re.sub(r'^[-•*]\s*', '', line.strip()) for line in lines if line.strip()]
-            cleaned = '\n'.join(lines)
 
-        
-        elif field_type == 'address':
-            # Remove address label prefixes
-            cleaned = re.sub(r'^(?:address|location)\s*:\s*', '', cleaned, flags=re.IGNORECASE)
-        
+        # Detect field type from question text unless the caller knows it
+        if field_type is None:
+            field_type = AnswerFormatter.detect_field_type(question_text)
+        
+        # FIELD-TYPE SPECIFIC EXTRACTION (table dispatch)
+        extractor = _FIELD_EXTRACTORS.get(field_type)
+        if extractor is not None:
+            extracted = extractor(cleaned)
+            if extracted is not None:
+                return extracted
+        else:
+            cleaner = _FIELD_CLEANERS.get(field_type)
+            if cleaner is not None:
+                cleaned = cleaner(cleaned)
+
         # GENERIC CLEANUP (all field types)
-        # Remove conversational prefixes
-        cleaned = re.sub(r'^The\s+\w+\s+(?:is|are)\s+', '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove source citations
-        cleaned = re.sub(r'\s*\[\s*(?:Source|Sources)\s*:.*?\]\s*', ' ', cleaned, flags=re.IGNORECASE | re.DOTALL)
+        # Remove conversational prefixes (only possible when the answer
+        # starts with "The" plus whitespace - the regex accepts any \s,
+        # not just a space - so skip the regex otherwise)
+        if cleaned[:3].lower() == 'the' and cleaned[3:4].isspace():
+            cleaned = _THE_X_IS_RE.sub('', cleaned)
+
+        # Remove source citations (cheap containment check first - most
+        # answers carry no bracketed citation at all)
+        if '[' in cleaned:
+            cleaned = _SOURCE_CITATION_RE.sub(' ', cleaned)
         
-        # Clean whitespace
-        cleaned = ' '.join(cleaned.split())
+        # Clean whitespace - only rewrite when a run/odd char exists;
+        # clean single-spaced answers skip the token split entirely
+        if _MULTIWS_RE.search(cleaned):
+            cleaned = _MULTIWS_RE.sub(' ', cleaned)
+        cleaned = cleaned.strip()
         
         # Remove trailing period only for very short answers (phone, email, dates)
         if field_type in ['phone', 'email', 'date'] and len(cleaned) < 100:
             cleaned = cleaned.rstrip('.')
         
         # Final validation
-        if not cleaned or cleaned.lower() in ['unknown', 'n/a', 'not available', 'not provided', '']:
+        if len(cleaned) <= 20 and cleaned.lower() in _NOT_FOUND_TOKENS:
             return "NOT_FOUND"
         
         return cleaned
     
     
     @staticmethod
-    def format_answer(answer_text: str, question_type: str, response_options: list, 
+    def format_answer(answer_text: str, question_type: str, response_options: list,
                     confidence: float, requires_explanation: bool = False) -> Dict:
         """
         Format answer - FAST PATH
-        
+
         Args:
             answer_text: Raw LLM answer
             question_type: Type of question
             response_options: Available response options
             confidence: Confidence score
             requires_explanation: Whether explanation is required (ONLY determinant)
-            
+
         Returns:
             Dict with formatted answer and optional explanation
         """
-        
+        # Canonical short answers ("Yes"/"No"/ratings) repeat constantly;
+        # serve those from the cache when every argument is hashable
+        # (rating_scale_1_to_9 passes a dict answer, which is not)
+        if isinstance(answer_text, str) and isinstance(response_options, (tuple, type(None))):
+            cached = _format_answer_cached(
+                answer_text, question_type, response_options, confidence, requires_explanation
+            )
+            return dict(cached)  # copy so callers can't poison the cache
+
+        return AnswerFormatter._format_answer_impl(
+            answer_text, question_type, response_options, confidence, requires_explanation
+        )
+
+    @staticmethod
+    def _format_answer_impl(answer_text, question_type: str, response_options,
+                            confidence: float, requires_explanation: bool = False) -> Dict:
+        """Uncached formatting workhorse behind format_answer"""
+
         # Fast path: No options = open-ended question
         if not response_options:
             return {
@@ -198,16 +407,11 @@ class AnswerFormatter:
         if not answer_text or not response_options:
             return 'Not Found'
         
-        answer_lower = answer_text.lower()
-        
-        # Single pass: Check first 100 chars only (where option usually is)
-        first_part = answer_lower[:100]
-        
-        for option in response_options:
-            if option.lower() in first_part:
-                return option
-        
-        return 'Not Found'
+        # Check first 100 chars only (where option usually is) - slice
+        # before lowercasing so multi-KB answers don't pay a full lower()
+        first_part = answer_text[:100].lower()
+
+        return _extract_option_cached(first_part, tuple(response_options))
     
     @staticmethod
     def _extract_explanation_fast(answer_text: str) -> str:
@@ -222,22 +426,22 @@ class AnswerFormatter:
         Returns:
             Explanation text
         """
-        if not answer_text or '.' not in answer_text:
+        if not answer_text:
             return ""
-        
-        # Find first period
+
+        # Find first period (single scan; the '.' containment pre-check
+        # was redundant with this)
         idx = answer_text.find('. ')
         if idx < 0:
             return ""
-        
-        # Get everything after first period
-        explanation = answer_text[idx + 2:].strip()
-        
-        # Remove source citations if present
-        if '[Source:' in explanation:
-            explanation = explanation[:explanation.index('[Source:')].strip()
-        
-        return explanation
+
+        # Slice once past the period, then trim around the citation (if
+        # any) without materializing intermediate stripped copies
+        rest = answer_text[idx + 2:]
+        src = rest.find('[Source:')
+        if src >= 0:
+            return rest[:src].strip()
+        return rest.strip()
     @staticmethod
     def _extract_multiple_options(answer_text: str, response_options: list) -> list:
         """
@@ -254,15 +458,9 @@ class AnswerFormatter:
             return []
         
         answer_lower = answer_text.lower()
-        selected = []
-        
+
         # Search full text for all matching options
-        for option in response_options:
-            option_lower = option.lower()
-            if option_lower in answer_lower:
-                selected.append(option)
-        
-        return selected
+        return list(_extract_multiple_cached(answer_lower, tuple(response_options)))
     @staticmethod
     def _extract_rating_1_to_9(answer_text_dict: dict, response_options: list) -> dict:
         """
@@ -363,37 +561,44 @@ class AnswerFormatter:
         if not llm_response or llm_response == 'NOT_FOUND':
             return ('Not Found', '', '')
         
-        # Extract rating number using regex
-        # Look for patterns like "RATING: 7" or "RATING: 7." or just "7."
-        rating_match = re.search(r'RATING:\s*(\d+)', llm_response, re.IGNORECASE)
-        
-        if not rating_match:
+        # Extract rating and explanation in one pass for the common
+        # "RATING: 7 ... EXPLANATION: ..." shape
+        explanation = ''
+        rating_match = _RATING_FULL_RE.search(llm_response)
+
+        if rating_match:
+            rating_number = int(rating_match.group('rating'))
+            explanation = (rating_match.group('expl') or '').strip()
+            if not explanation:
+                # An EXPLANATION label can precede the rating; the
+                # combined pattern only captures one that follows it
+                explanation_match = _EXPLANATION_RE.search(llm_response)
+                if explanation_match:
+                    explanation = explanation_match.group(1).strip()
+        else:
             # Fallback: Look for first number in response
-            fallback_match = re.search(r'\b([1-9])\b', llm_response)
+            fallback_match = _FALLBACK_DIGIT_RE.search(llm_response)
             if fallback_match:
                 rating_number = int(fallback_match.group(1))
             else:
                 return ('Not Found', '', '')
-        else:
-            rating_number = int(rating_match.group(1))
-        
+
+            explanation_match = _EXPLANATION_RE.search(llm_response)
+            if explanation_match:
+                explanation = explanation_match.group(1).strip()
+
         # Validate rating is in valid range
         max_rating = len(response_options)
         if rating_number < 1 or rating_number > max_rating:
             return ('Not Found', '', f'Invalid rating: {rating_number}')
-        
+
         # Get the full option text from response_options
         rating_option = response_options[rating_number - 1]  # Convert 1-indexed to 0-indexed
-        
-        # Extract explanation (text after "EXPLANATION:")
-        explanation = ''
-        explanation_match = re.search(r'EXPLANATION:\s*(.+)', llm_response, re.IGNORECASE | re.DOTALL)
-        if explanation_match:
-            explanation = explanation_match.group(1).strip()
-        else:
+
+        if not explanation:
             # Fallback: Use everything after the rating line
             lines = llm_response.split('\n')
             if len(lines) > 1:
                 explanation = '\n'.join(lines[1:]).strip()
-        
+
         return (rating_number, rating_option, explanation)
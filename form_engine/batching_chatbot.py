@@ -0,0 +1,126 @@
+"""
+BatchingChatbot - Request-coalescing wrapper around ChatbotAdapter
+
+Buffers ask() calls arriving within a short window (or until max_batch
+queries queue up) and dispatches the whole batch at once through the
+adapter's concurrent path, amortizing per-request overhead when many
+callers hit the chatbot at the same time.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import config
+from .chatbot_adapter import ChatbotAdapter
+
+
+class BatchingChatbot:
+    """
+    Coalesces concurrent ask() calls into batched dispatches
+
+    Each ask() enqueues the query and blocks on a Future; a background
+    drainer collects up to max_batch queued queries (waiting at most
+    max_wait_ms for stragglers) and runs them together on a thread
+    pool, so N near-simultaneous callers pay one dispatch instead of N.
+    """
+
+    def __init__(self, adapter: ChatbotAdapter, max_batch: int = 16, max_wait_ms: int = 50):
+        """
+        Args:
+            adapter: The ChatbotAdapter to dispatch through
+            max_batch: Maximum queries per batched dispatch
+            max_wait_ms: How long to wait for more queries to coalesce
+        """
+        self.adapter = adapter
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._drainer = threading.Thread(target=self._drain_loop, daemon=True)
+        self._drainer.start()
+
+    def ask(self, query: str, top_k: int = None, context: str = None) -> Dict:
+        """Ask one question; blocks until its batched result is ready"""
+        return self.submit(query, top_k=top_k, context=context).result()
+
+    def submit(self, query: str, top_k: int = None, context: str = None) -> Future:
+        """Enqueue a question, returning a Future for its result"""
+        if self._closed:
+            raise RuntimeError("BatchingChatbot is closed")
+
+        future: Future = Future()
+        self._queue.put((query, top_k, context, future))
+        return future
+
+    def __getattr__(self, name):
+        """Delegate everything else (prefetch, cache_clear, chatbot, ...)
+        to the wrapped adapter so the coalescer is a drop-in stand-in"""
+        try:
+            adapter = self.__dict__['adapter']
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(adapter, name)
+
+    def close(self):
+        """Stop accepting queries and shut down the drainer"""
+        self._closed = True
+        self._queue.put(None)  # wake the drainer
+        self._drainer.join()
+
+        # A submit racing close can land behind the sentinel; fail those
+        # futures instead of leaving their callers blocked forever
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[3].set_exception(RuntimeError("BatchingChatbot is closed"))
+
+    def _drain_loop(self):
+        """Collect queued queries into batches and dispatch them"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+
+            # Coalesce: grab whatever else arrives inside the window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    extra = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if extra is None:
+                    self._dispatch(batch)
+                    return
+                batch.append(extra)
+
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[tuple]):
+        """Run one batch concurrently, resolving each caller's Future"""
+        max_workers = min(len(batch), getattr(config, 'MAX_WORKERS', 5))
+
+        def run_one(item):
+            query, top_k, context, future = item
+            try:
+                future.set_result(self.adapter.ask(query, top_k=top_k, context=context))
+            except Exception as e:
+                future.set_exception(e)
+
+        if len(batch) == 1:
+            run_one(batch[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(run_one, batch))
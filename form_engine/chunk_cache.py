@@ -4,46 +4,58 @@ Retrieves chunks once per page instead of per question
 """
 
 from typing import Dict, List, Optional
-from collections import defaultdict
+from collections import OrderedDict
 
 class ChunkCache:
     """
     Cache retrieved document chunks by page number
     Massively speeds up batch processing
+
+    Bounded LRU: the least recently used page is evicted once max_size
+    pages are cached, so memory stays flat on very long documents.
     """
-    
-    def __init__(self):
-        """Initialize empty cache"""
-        self.cache = {}  # {page_number: chunks}
+
+    def __init__(self, max_size: int = 64):
+        """Initialize empty cache
+
+        Args:
+            max_size: Maximum number of pages to keep cached
+        """
+        self.cache = OrderedDict()  # {page_number: chunks}, LRU order
+        self.max_size = max_size
         self.hit_count = 0
         self.miss_count = 0
-    
+
     def get_chunks(self, page_number: int) -> Optional[List[Dict]]:
         """
         Get cached chunks for a page
-        
+
         Args:
             page_number: Page number to retrieve
-        
+
         Returns:
             Cached chunks or None if not cached
         """
         if page_number in self.cache:
             self.hit_count += 1
+            self.cache.move_to_end(page_number)  # mark most recently used
             return self.cache[page_number]
-        
+
         self.miss_count += 1
         return None
-    
+
     def cache_chunks(self, page_number: int, chunks: List[Dict]) -> None:
         """
         Cache chunks for a page
-        
+
         Args:
             page_number: Page number
             chunks: Retrieved chunks from RAG
         """
         self.cache[page_number] = chunks
+        self.cache.move_to_end(page_number)
+        if len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)  # evict least recently used
     
     def clear(self):
         """Clear all cached chunks"""
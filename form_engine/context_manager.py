@@ -6,9 +6,26 @@ into the prompt for each question based on question structure
 and text analysis.
 """
 
-from typing import Optional, List, Tuple  # Added Tuple here
+from functools import lru_cache
+from typing import Callable, Optional, List, Tuple  # Added Tuple here
+import numpy as np
 from .section_memory import SectionMemory, AnsweredQuestion
 from .question_analyzer import QuestionAnalyzer
+import config
+
+# Shared line template for all context formats; one .format per answer
+# through a generator feeding a single join (no intermediate list)
+_CONTEXT_LINE = '- Q{qid}: "{qtext}" → Answer: "{ans}"'
+
+
+@lru_cache(maxsize=256)
+def _lower_required_values(values: tuple) -> tuple:
+    """Lowercased copy of a conditional-display value tuple, cached
+
+    The same small set of gating values recurs across every conditional
+    question in a section, so lowercase each list once.
+    """
+    return tuple(value.lower() for value in values)
 
 
 class ContextManager:
@@ -16,28 +33,82 @@ class ContextManager:
     Manages context retrieval and formatting for questions
     """
     
-    def __init__(self):
+    def __init__(self, embedder: Optional[Callable] = None):
+        """
+        Args:
+            embedder: Optional callable mapping text to an embedding
+                      vector (e.g. SimpleRAGChatbot.get_embedding). When
+                      provided, synthesis questions get the top-K most
+                      relevant prior answers instead of the full dump.
+        """
         self.memory = SectionMemory()
         self.analyzer = QuestionAnalyzer()
-    
+        self.embedder = embedder
+        self._answer_embeddings = {}  # question_id -> unit vector
+
+        # Formatted-context cache: sub-questions sharing a parent chain
+        # (all of Q3.x) rebuild identical strings; invalidated whenever
+        # memory mutates via the version counter
+        self._ctx_cache = {}
+        # Skip decisions keyed by (parent_id, required values): many
+        # children share one gate, so each gate is evaluated once per
+        # memory version and answered by dict lookup afterwards
+        self._skip_cache = {}
+        self._version = 0
+
+    def _bump_version(self):
+        """Invalidate cached context strings after a memory mutation"""
+        self._version += 1
+        self._ctx_cache.clear()
+        self._skip_cache.clear()
+
     def update_section(self, section_name: str):
         """
         Update current section (clears memory if changed)
-        
+
         Args:
             section_name: Name of the new section
         """
-        self.memory.set_section(section_name)
-    
+        # Only a real section change mutates memory; re-announcing the
+        # same section (every page does) must not wipe the caches
+        if self.memory.current_section != section_name:
+            self._answer_embeddings.clear()
+            self.memory.set_section(section_name)
+            self._bump_version()
+
     def add_answer(self, question: dict, answer: str):
         """
         Add an answered question to memory
-        
+
         Args:
             question: Question dict with metadata
             answer: The answer text
         """
         self.memory.add_answer(question, answer)
+        # A re-answered question invalidates its lazily cached embedding
+        self._answer_embeddings.pop(question.get('question_id', ''), None)
+        self._bump_version()
+
+    def _embed_unit(self, text: str):
+        """Unit-length embedding of text, or None on failure"""
+        vector = np.asarray(self.embedder(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            return vector / norm
+        return None
+
+    def _answer_embedding(self, answered: AnsweredQuestion):
+        """Embedding for a stored answer, computed lazily and cached
+
+        Embedding only happens when a synthesis question actually needs
+        top-K selection, not on every add_answer.
+        """
+        cached = self._answer_embeddings.get(answered.question_id)
+        if cached is None:
+            cached = self._embed_unit(f"{answered.question_text} {answered.answer}")
+            if cached is not None:
+                self._answer_embeddings[answered.question_id] = cached
+        return cached
     
     def get_context(self, question: dict) -> Optional[str]:
         """
@@ -63,9 +134,10 @@ class ContextManager:
             start_id, end_id = range_match
             return self._format_range_context(start_id, end_id)
         
-        # Rule 3: Synthesis questions need full section
+        # Rule 3: Synthesis questions need section context (top-K most
+        # relevant answers when an embedder is available)
         if self.analyzer.is_synthesis_question(question_text):
-            return self._format_section_context()
+            return self._format_section_context(question_text)
         
         # No context needed
         return None
@@ -88,33 +160,37 @@ class ContextManager:
         
         parent_id = conditional.get('parent_question_id')
         required_values = conditional.get('parent_response_values', [])
-        
+
         if not parent_id or not required_values:
             return (False, "")
-        
+
+        # Shared gate already decided for this memory version?
+        gate_key = (parent_id, tuple(required_values))
+        cached = self._skip_cache.get(gate_key)
+        if cached is not None:
+            return cached
+
         # Get parent answer from memory
         parent_answered = self.memory.get_answer(parent_id)
-        
+
         if not parent_answered:
             # Parent not answered yet - DON'T SKIP (parent might not have context yet)
             # Only skip if we're SURE parent is answered and doesn't match
-            return (False, "")
-        
-        # Check if parent answer matches required values
-        parent_ans_lower = parent_answered.answer.lower()
-        
-        # More flexible matching
-        skip = True
-        for req_val in required_values:
-            if req_val.lower() in parent_ans_lower:
-                skip = False
-                break
-        
-        if skip:
-            reason = f"Parent Q{parent_id} = '{parent_answered.answer}', needed: {required_values}"
-            return (True, reason)
-        
-        return (False, "")
+            decision = (False, "")
+        else:
+            # Check if parent answer matches required values (flexible
+            # substring matching, required values lowercased once per list)
+            parent_ans_lower = parent_answered.answer.lower()
+            req_lower = _lower_required_values(gate_key[1])
+
+            if not any(req_val in parent_ans_lower for req_val in req_lower):
+                reason = f"Parent Q{parent_id} = '{parent_answered.answer}', needed: {required_values}"
+                decision = (True, reason)
+            else:
+                decision = (False, "")
+
+        self._skip_cache[gate_key] = decision
+        return decision
 
     def _format_parent_context(self, parent_ids: List[str]) -> Optional[str]:
         """
@@ -126,16 +202,22 @@ class ContextManager:
         Returns:
             Formatted context string or None if no parents found
         """
+        cache_key = ('parent', self._version, tuple(parent_ids))
+        if cache_key in self._ctx_cache:
+            return self._ctx_cache[cache_key]
+
         parents = self.memory.get_answers_by_ids(parent_ids)
-        
+
         if not parents:
-            return None
-        
-        context_parts = ["Previous questions in this chain:"]
-        for p in parents:
-            context_parts.append(f"- Q{p.question_id}: \"{p.question_text}\" → Answer: \"{p.answer}\"")
-        
-        return "\n".join(context_parts)
+            context = None
+        else:
+            context = "Previous questions in this chain:\n" + "\n".join(
+                _CONTEXT_LINE.format(qid=p.question_id, qtext=p.question_text, ans=p.answer)
+                for p in parents
+            )
+
+        self._ctx_cache[cache_key] = context
+        return context
     
     def _format_range_context(self, start_id: str, end_id: str) -> Optional[str]:
         """
@@ -148,35 +230,88 @@ class ContextManager:
         Returns:
             Formatted context string or None if no answers in range
         """
+        cache_key = ('range', self._version, start_id, end_id)
+        if cache_key in self._ctx_cache:
+            return self._ctx_cache[cache_key]
+
         answers = self.memory.get_answers_in_range(start_id, end_id)
-        
+
         if not answers:
-            return None
-        
-        context_parts = [f"Previous answers from Q{start_id} to Q{end_id}:"]
-        for a in answers:
-            context_parts.append(f"- Q{a.question_id}: \"{a.question_text}\" → Answer: \"{a.answer}\"")
-        
-        return "\n".join(context_parts)
+            context = None
+        else:
+            context = f"Previous answers from Q{start_id} to Q{end_id}:\n" + "\n".join(
+                _CONTEXT_LINE.format(qid=a.question_id, qtext=a.question_text, ans=a.answer)
+                for a in answers
+            )
+
+        self._ctx_cache[cache_key] = context
+        return context
     
-    def _format_section_context(self) -> Optional[str]:
+    def _select_top_k(self, question_text: str, answers: List[AnsweredQuestion],
+                      k: int) -> List[AnsweredQuestion]:
         """
-        Format full section context
-        
+        Keep the k answers most relevant to question_text
+
+        Scores cached answer embeddings against the question embedding
+        with one matmul; falls back to the k most recent answers when
+        embeddings are unavailable. Selected answers keep their original
+        relative order.
+        """
+        if self.embedder is not None:
+            try:
+                scored = [(a.question_id, self._answer_embedding(a)) for a in answers]
+                scored = [(qid, vec) for qid, vec in scored if vec is not None]
+
+                if len(scored) >= k:
+                    query_vec = self._embed_unit(question_text)
+                    if query_vec is not None:
+                        matrix = np.stack([vec for _, vec in scored])
+                        similarities = matrix @ query_vec
+
+                        keep = {scored[i][0] for i in np.argsort(-similarities)[:k]}
+                        return [a for a in answers if a.question_id in keep]
+            except Exception:
+                pass  # fall through to recency
+
+        # Recency fallback: the last k answers
+        return answers[-k:]
+
+    def _format_section_context(self, question_text: str = '') -> Optional[str]:
+        """
+        Format section context for a synthesis question
+
         Returns:
             Formatted context string or None if no answers in section
         """
-        answers = self.memory.get_all_answers()
-        
+        cache_key = ('section', self._version, question_text)
+        if cache_key in self._ctx_cache:
+            return self._ctx_cache[cache_key]
+
+        # Insertion order, not sort order: the section context is the
+        # prompt prefix for every synthesis question, and an append-only
+        # log keeps that prefix byte-stable so provider prompt caches
+        # keep hitting as the section grows
+        answers = self.memory.get_answer_log()
+
+        # Bound the dump: beyond CONTEXT_TOP_K answers, inject only the
+        # most relevant (or most recent) ones instead of the whole section
+        top_k = getattr(config, 'CONTEXT_TOP_K', 8)
+        if len(answers) > top_k:
+            answers = self._select_top_k(question_text, answers, top_k)
+
         if not answers:
-            return None
-        
-        context_parts = ["Previous answers in this section:"]
-        for a in answers:
-            context_parts.append(f"- Q{a.question_id}: \"{a.question_text}\" → Answer: \"{a.answer}\"")
-        
-        return "\n".join(context_parts)
+            context = None
+        else:
+            context = "Previous answers in this section:\n" + "\n".join(
+                _CONTEXT_LINE.format(qid=a.question_id, qtext=a.question_text, ans=a.answer)
+                for a in answers
+            )
+
+        self._ctx_cache[cache_key] = context
+        return context
     
     def clear(self):
         """Clear all memory"""
         self.memory.clear()
+        self._answer_embeddings.clear()
+        self._bump_version()
@@ -2,18 +2,78 @@
 parallel_processor.py - Process questions in parallel with context awareness
 """
 
+import sys
 import time
+import threading
 from typing import List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .chatbot_adapter import ChatbotAdapter
+from .batching_chatbot import BatchingChatbot
 from .chunk_cache import ChunkCache
 from .question_processor import QuestionProcessor
 from .answer_formatter import AnswerFormatter
 from .context_manager import ContextManager
+from enhancements.query_enhancer import (
+    enhance_checkbox_query,
+    enhance_rating_1_to_9_query,
+    enhance_rating_1_to_5_query,
+)
 import config
 
 
+def _handle_checkbox(processor, q_text: str, response_options, context) -> tuple:
+    """checkbox_group: enhance the query with the options, one ask"""
+    enhanced_query = enhance_checkbox_query(q_text, response_options)
+    result = processor.chatbot.ask(query=enhanced_query, context=context)
+    return result.get('answer', 'NOT_FOUND'), result.get('sources', [])
+
+
+def _handle_rating_9(processor, q_text: str, response_options, context) -> tuple:
+    """rating_scale_1_to_9: dual ask (alleged + suffered), merged sources
+
+    The two asks are independent network calls sharing one context, so
+    they run concurrently instead of back to back.
+    """
+    query_alleged = enhance_rating_1_to_9_query(q_text, response_options, aspect="alleged")
+    query_suffered = enhance_rating_1_to_9_query(q_text, response_options, aspect="suffered")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_alleged = executor.submit(processor.chatbot.ask, query=query_alleged, context=context)
+        future_suffered = executor.submit(processor.chatbot.ask, query=query_suffered, context=context)
+        result_alleged = future_alleged.result()
+        result_suffered = future_suffered.result()
+
+    answer_text = {
+        'alleged': result_alleged.get('answer', 'NOT_FOUND'),
+        'suffered': result_suffered.get('answer', 'NOT_FOUND')
+    }
+    sources = result_alleged.get('sources', []) + result_suffered.get('sources', [])
+    return answer_text, sources
+
+
+def _handle_rating_5(processor, q_text: str, response_options, context) -> tuple:
+    """rating_scale_1_to_5: enhanced query, one ask"""
+    enhanced_query = enhance_rating_1_to_5_query(q_text, response_options)
+    result = processor.chatbot.ask(query=enhanced_query, context=context)
+    return result.get('answer', 'NOT_FOUND'), result.get('sources', [])
+
+
+def _handle_default(processor, q_text: str, response_options, context) -> tuple:
+    """Everything else: ask the question as-is"""
+    result = processor.chatbot.ask(query=q_text, context=context)
+    return result.get('answer', 'NOT_FOUND'), result.get('sources', [])
+
+
+# q_type → handler; one dict lookup replaces the if/elif string compares
+# and keeps the ask-and-unpack boilerplate in one place per type
+_QTYPE_HANDLERS = {
+    'checkbox_group': _handle_checkbox,
+    'rating_scale_1_to_9': _handle_rating_9,
+    'rating_scale_1_to_5': _handle_rating_5,
+}
+
+
 class ParallelProcessor:
     """
     Process questions in parallel with page-level caching and context awareness
@@ -21,14 +81,21 @@ class ParallelProcessor:
 
     def __init__(self, chatbot_adapter: ChatbotAdapter):
         self.chatbot = chatbot_adapter
+        if getattr(config, 'ENABLE_REQUEST_COALESCING', False):
+            # Coalesce the concurrent asks coming from the page worker
+            # threads (and the dual rating calls) into batched dispatches
+            self.chatbot = BatchingChatbot(chatbot_adapter)
         self.cache = ChunkCache()
-        self.context_manager = ContextManager()
+        self.context_manager = ContextManager(
+            embedder=getattr(getattr(chatbot_adapter, 'chatbot', None), 'get_embedding', None)
+        )
         self.max_workers = config.MAX_WORKERS
         self.stats = {
             'total_time': 0,
             'questions_with_context': 0,
             'questions_skipped': 0
         }
+        self._stats_lock = threading.Lock()
 
     def process_page(self, page_questions: List[Dict], page_index: int, total_pages: int) -> List[Dict]:
         """
@@ -45,7 +112,6 @@ class ParallelProcessor:
         if not page_questions:
             return []
 
-        answered = []
         page_num = page_questions[0].get('page_number')
 
         # Update section context
@@ -53,7 +119,67 @@ class ParallelProcessor:
         if section_name:
             self.context_manager.update_section(section_name)
 
-        # Process each question
+        if not getattr(config, 'ENABLE_PARALLEL', True) or len(page_questions) <= 1:
+            return self._process_questions_serial(page_questions)
+
+        # Split the page: questions whose context/skip rules hinge on an
+        # answer from this same page must run after it lands; everything
+        # else is independent I/O-bound work and fans out over threads
+        page_ids = {q.get('question_id') for q in page_questions if q.get('question_id')}
+        analyzer = self.context_manager.analyzer
+
+        def needs_same_page_answer(question: Dict) -> bool:
+            conditional = question.get('conditional_display') or {}
+            if conditional.get('parent_question_id') in page_ids:
+                return True
+
+            # Range (Q1-7) and synthesis questions read section memory,
+            # which includes answers from this very page under the
+            # serial baseline - run them after those answers land
+            question_text = question.get('main_question', '')
+            if analyzer.parse_question_range(question_text) or \
+                    analyzer.is_synthesis_question(question_text):
+                return True
+
+            parts = question.get('question_id', '').split('.')
+            return any('.'.join(parts[:i]) in page_ids for i in range(1, len(parts)))
+
+        independent = []
+        dependent = []
+        for index, question in enumerate(page_questions):
+            (dependent if needs_same_page_answer(question) else independent).append((index, question))
+
+        results: List[Dict] = [None] * len(page_questions)
+
+        if independent:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(independent))) as executor:
+                futures = {
+                    executor.submit(self._answer_question, question): index
+                    for index, question in independent
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+            # Record answers on the main thread, in page order, so
+            # ContextManager stays single-threaded
+            for index, question in independent:
+                result = results[index]
+                if result.get('answer') not in ['NOT_FOUND', 'SKIPPED']:
+                    self.context_manager.add_answer(question, result['answer'])
+
+        # Dependents keep the original serial, interleaved semantics
+        for index, question in dependent:
+            result = self._answer_question(question)
+            results[index] = result
+            if result.get('answer') not in ['NOT_FOUND', 'SKIPPED']:
+                self.context_manager.add_answer(question, result['answer'])
+
+        return results
+
+    def _process_questions_serial(self, page_questions: List[Dict]) -> List[Dict]:
+        """Answer questions one by one, feeding memory after each"""
+        answered = []
+
         for question in page_questions:
             result = self._answer_question(question)
             answered.append(result)
@@ -84,7 +210,8 @@ class ParallelProcessor:
         # Check if question should be skipped
         should_skip, skip_reason = self.context_manager.should_skip_question(question)
         if should_skip:
-            self.stats['questions_skipped'] += 1
+            with self._stats_lock:
+                self.stats['questions_skipped'] += 1
             return {
                 'section_name': question.get('section_name', ''),
                 'question_id': q_id,
@@ -102,80 +229,39 @@ class ParallelProcessor:
         if config.ENABLE_CONTEXT_INJECTION:
             context = self.context_manager.get_context(question)
             if context:
-                self.stats['questions_with_context'] += 1
-
-        # # Include response options in query for checkbox_group questions
-        # if q_type == 'checkbox_group' and response_options:
-        #     from enhancements.query_enhancer import enhance_checkbox_query
-        #     enhanced_query = enhance_checkbox_query(q_text, response_options)
-        # else:
-        #     enhanced_query = q_text
-
-        # # Ask question with context
-        # result = self.chatbot.ask(query=enhanced_query, context=context)
-                # Include response options in query for checkbox_group questions
-        if q_type == 'checkbox_group' and response_options:
-            from enhancements.query_enhancer import enhance_checkbox_query
-            enhanced_query = enhance_checkbox_query(q_text, response_options)
-            # Ask question with context
-            result = self.chatbot.ask(query=enhanced_query, context=context)
-            answer_text = result.get('answer', 'NOT_FOUND')
-            sources = result.get('sources', [])
-            
-        # ========== NEW: Handle rating_scale_1_to_9 (dual rating) ==========
-        elif q_type == 'rating_scale_1_to_9' and response_options:
-            from enhancements.query_enhancer import enhance_rating_1_to_9_query
-            
-            # Call 1: Get rating for "alleged"
-            query_alleged = enhance_rating_1_to_9_query(q_text, response_options, aspect="alleged")
-            result_alleged = self.chatbot.ask(query=query_alleged, context=context)
-            
-            # Call 2: Get rating for "suffered"
-            query_suffered = enhance_rating_1_to_9_query(q_text, response_options, aspect="suffered")
-            result_suffered = self.chatbot.ask(query=query_suffered, context=context)
-            
-            # Combine results
-            answer_text = {
-                'alleged': result_alleged.get('answer', 'NOT_FOUND'),
-                'suffered': result_suffered.get('answer', 'NOT_FOUND')
-            }
-            
-            # Combine sources from both calls
-            sources_alleged = result_alleged.get('sources', [])
-            sources_suffered = result_suffered.get('sources', [])
-            sources = sources_alleged + sources_suffered
-            
-        # ========== NEW: Handle rating_scale_1_to_5 (single rating) ==========
-        elif q_type == 'rating_scale_1_to_5' and response_options:
-            from enhancements.query_enhancer import enhance_rating_1_to_5_query
-            enhanced_query = enhance_rating_1_to_5_query(q_text, response_options)
-            # Ask question with context
-            result = self.chatbot.ask(query=enhanced_query, context=context)
-            answer_text = result.get('answer', 'NOT_FOUND')
-            sources = result.get('sources', [])
-            
-        else:
-            # Default: no enhancement
-            enhanced_query = q_text
-            # Ask question with context
-            result = self.chatbot.ask(query=enhanced_query, context=context)
-            answer_text = result.get('answer', 'NOT_FOUND')
-            sources = result.get('sources', [])
-
+                with self._stats_lock:
+                    self.stats['questions_with_context'] += 1
 
+        # Dispatch by question type (special handlers only apply when
+        # the question actually carries response options)
+        if response_options:
+            handler = _QTYPE_HANDLERS.get(q_type, _handle_default)
+        else:
+            handler = _handle_default
+        answer_text, sources = handler(self, q_text, response_options, context)
+
+        # One pass over sources: accumulate similarity for confidence and
+        # build the output entries with each dict value fetched once
+        similarity_total = 0.0
+        formatted_sources = []
+        for s in sources:
+            meta = s.get('metadata') or {}
+            chunk = s.get('chunk', '')
+            similarity = s.get('similarity', 0.0)
+            similarity_total += similarity
+            formatted_sources.append({
+                'file': meta.get('source', 'Unknown'),
+                'pages': meta.get('page_numbers', []),
+                'similarity': similarity,
+                'chunk_preview': chunk[:200],
+                'chunk_full': chunk  # ← Full chunk text
+            })
 
-        # # Extract answer and sources
-        # answer_text = result.get('answer', 'NOT_FOUND')
-        # sources = result.get('sources', [])
-
-        # Calculate confidence from sources
         if sources:
-            avg_similarity = sum(s.get('similarity', 0.0) for s in sources) / len(sources)
-            confidence = min(1.0, avg_similarity / 100.0)
+            confidence = min(1.0, similarity_total / len(sources) / 100.0)
         else:
             confidence = 0.0
 
-        # Format answer based on question type and requires_explanation
         # Format answer based on question type and requires_explanation
         formatted = AnswerFormatter.format_answer(
             answer_text,
@@ -197,16 +283,7 @@ class ParallelProcessor:
             'raw_answer': answer_text,  # ← NEW: Store raw LLM answer
             'confidence': formatted['confidence'],
             'page_number': page_num,
-            'sources': [
-                {
-                    'file': s.get('metadata', {}).get('source', 'Unknown'),
-                    'pages': s.get('metadata', {}).get('page_numbers', []),
-                    'similarity': s.get('similarity', 0.0),
-                    'chunk_preview': s.get('chunk', '')[:200],
-                    'chunk_full': s.get('chunk', '')  # ← Full chunk text
-                }
-                for s in sources
-            ],
+            'sources': formatted_sources,
             'used_context': context is not None
         }
 
@@ -215,12 +292,6 @@ class ParallelProcessor:
             answer_result['explanation'] = formatted['explanation']
 
         return answer_result
-        
-        # Add explanation if present and required
-        if 'explanation' in formatted:
-            answer_result['explanation'] = formatted['explanation']
-
-        return answer_result
 
     def process_all_pages(self, question_processor: QuestionProcessor) -> List[Dict]:
         """
@@ -247,14 +318,25 @@ class ParallelProcessor:
         page_counter = 0
         current_section = None  # Track current section
 
+        # One background worker warms the next page's query embeddings
+        # while the current page's LLM calls are in flight
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+
         # Process pages sequentially to maintain context order
-        for page_num in page_numbers:
+        for i, page_num in enumerate(page_numbers):
             page_counter += 1
             page_questions = question_processor.get_questions_by_page(page_num)
 
             if not page_questions:
                 continue
 
+            if i + 1 < len(page_numbers) and hasattr(self.chatbot, 'prefetch'):
+                next_questions = question_processor.get_questions_by_page(page_numbers[i + 1])
+                prefetch_pool.submit(
+                    self.chatbot.prefetch,
+                    [q.get('main_question', '') for q in next_questions]
+                )
+
             # Get section for this page
             page_section = page_questions[0].get('section_name', '')
 
@@ -262,9 +344,12 @@ class ParallelProcessor:
             if page_section != current_section:
                 print(f"   📂 Section changed: {current_section or 'None'} → {page_section}")
                 self.context_manager.update_section(page_section)
+                # Cached ask results are keyed on context that just
+                # turned over with the section - drop them
+                if hasattr(self.chatbot, 'cache_clear'):
+                    self.chatbot.cache_clear()
                 current_section = page_section
 
-            print(f"   [{page_counter}/{total_pages}] Page {page_num}: {len(page_questions)} Q's ({page_section})", end=" ")
             page_start = time.time()
 
             # Process page
@@ -272,7 +357,12 @@ class ParallelProcessor:
             all_results.extend(page_results)
 
             elapsed = time.time() - page_start
-            print(f"✓ {elapsed:.1f}s")
+            # One atomic line per page - no split prints interleaving
+            # with worker-thread output
+            print(f"   [{page_counter}/{total_pages}] Page {page_num}: "
+                  f"{len(page_questions)} Q's ({page_section}) ✓ {elapsed:.1f}s")
+
+        prefetch_pool.shutdown(wait=False)
 
         total_time = time.time() - global_start
         self.stats['total_time'] = total_time
@@ -283,19 +373,25 @@ class ParallelProcessor:
         return all_results
 
     def _print_summary(self, answers: List[Dict], total_time: float):
-        """Print execution summary"""
+        """Print execution summary as a single buffered write"""
         answered = [a for a in answers if a.get('answer') not in ['NOT_FOUND', 'SKIPPED']]
         not_found = len([a for a in answers if a.get('answer') == 'NOT_FOUND'])
         skipped = len([a for a in answers if a.get('answer') == 'SKIPPED'])
 
-        print(f"\n{'='*70}")
-        print(f"✅ Processing Complete")
-        print(f"{'='*70}")
-        print(f"Total Questions:    {len(answers)}")
-        print(f"Answered:          {len(answered)} ({len(answered)/len(answers)*100:.1f}%)")
-        print(f"Not Found:         {not_found} ({not_found/len(answers)*100:.1f}%)")
-        print(f"Skipped:           {skipped} ({skipped/len(answers)*100:.1f}%)")
-        print(f"With Context:      {self.stats['questions_with_context']}")
-        print(f"Time Taken:        {total_time:.2f}s")
-        print(f"Avg per Q:         {total_time/len(answers):.2f}s")
-        print(f"{'='*70}\n")
+        lines = [
+            "",
+            "=" * 70,
+            "✅ Processing Complete",
+            "=" * 70,
+            f"Total Questions:    {len(answers)}",
+            f"Answered:          {len(answered)} ({len(answered)/len(answers)*100:.1f}%)",
+            f"Not Found:         {not_found} ({not_found/len(answers)*100:.1f}%)",
+            f"Skipped:           {skipped} ({skipped/len(answers)*100:.1f}%)",
+            f"With Context:      {self.stats['questions_with_context']}",
+            f"Time Taken:        {total_time:.2f}s",
+            f"Avg per Q:         {total_time/len(answers):.2f}s",
+            "=" * 70,
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
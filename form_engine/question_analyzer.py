@@ -16,14 +16,15 @@ class QuestionAnalyzer:
     Analyzes questions to determine what context they need
     """
     
-    # Regex patterns for detecting question ranges
+    # Regex patterns for detecting question ranges (compiled once at
+    # class definition; parse_question_range runs per question)
     RANGE_PATTERNS = [
-        r'Q(\d+)-(\d+)',                          # Q1-7
-        r'Q(\d+)\s+to\s+Q?(\d+)',                 # Q1 to 7, Q1 to Q7
-        r'questions?\s+(\d+)\s+through\s+(\d+)',  # question 1 through 7
-        r'Question\s+(\d+)\s+to\s+Question\s+(\d+)',  # Question 1 to Question 7
+        re.compile(r'Q(\d+)-(\d+)', re.IGNORECASE),                          # Q1-7
+        re.compile(r'Q(\d+)\s+to\s+Q?(\d+)', re.IGNORECASE),                 # Q1 to 7, Q1 to Q7
+        re.compile(r'questions?\s+(\d+)\s+through\s+(\d+)', re.IGNORECASE),  # question 1 through 7
+        re.compile(r'Question\s+(\d+)\s+to\s+Question\s+(\d+)', re.IGNORECASE),  # Question 1 to Question 7
     ]
-    
+
     # Keywords indicating synthesis questions
     SYNTHESIS_KEYWORDS = [
         'additional insights',
@@ -36,6 +37,9 @@ class QuestionAnalyzer:
         'any other',
         'further details'
     ]
+
+    # Single alternation scan instead of N substring passes per question
+    _SYNTHESIS_RE = re.compile('|'.join(map(re.escape, SYNTHESIS_KEYWORDS)), re.IGNORECASE)
     
     @staticmethod
     def extract_parent_chain(question_id: str) -> List[str]:
@@ -86,11 +90,11 @@ class QuestionAnalyzer:
             Tuple of (start_id, end_id) or None if no range found
         """
         for pattern in cls.RANGE_PATTERNS:
-            match = re.search(pattern, question_text, re.IGNORECASE)
+            match = pattern.search(question_text)
             if match:
                 start_id, end_id = match.groups()
                 return (start_id, end_id)
-        
+
         return None
     
     @classmethod
@@ -104,13 +108,7 @@ class QuestionAnalyzer:
         Returns:
             True if synthesis question, False otherwise
         """
-        question_lower = question_text.lower()
-        
-        for keyword in cls.SYNTHESIS_KEYWORDS:
-            if keyword in question_lower:
-                return True
-        
-        return False
+        return cls._SYNTHESIS_RE.search(question_text) is not None
     
     @staticmethod
     def is_sub_question(question_id: str) -> bool:
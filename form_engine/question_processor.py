@@ -4,8 +4,14 @@ Groups questions by page number, handles parent-subquestion relationships
 """
 
 import json
+import sys
 from typing import Dict, List, Optional
-from collections import defaultdict
+
+# C-backed JSON parsing (with stdlib fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class QuestionProcessor:
     """
@@ -24,18 +30,24 @@ class QuestionProcessor:
         """
         self.questions_file = questions_file
         self.all_questions = []
-        self.questions_by_page = defaultdict(list)
+        self.questions_by_page = {}
         self.questions_by_id = {}
-        self.parent_subquestion_map = defaultdict(list)
-        
+        self.parent_subquestion_map = {}
+        self._sorted_page_numbers = []
+
         self._load_questions()
     
     def _load_questions(self):  
         """Load and parse questions.json"""  
-        try:  
-            # Open the file with UTF-8 encoding  
-            with open(self.questions_file, 'r', encoding='utf-8') as f:  
-                data = json.load(f)  # Load JSON data  
+        try:
+            # Load JSON data (orjson parses large question files several
+            # times faster than stdlib json when available)
+            if orjson is not None:
+                with open(self.questions_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.questions_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
     
             # Handle different JSON formats  
             if isinstance(data, list):  
@@ -69,20 +81,37 @@ class QuestionProcessor:
             if skipped_count > 0:  
                 print(f"⚠ Skipped {skipped_count} non-question items")  
     
-            # Organize by page and ID  
-            for q in self.all_questions:  
-                page = q.get('page_number')  
-                q_id = q.get('question_id')  
-                parent_id = q.get('parent_question_id', '')  
-    
-                if page:  
-                    self.questions_by_page[page].append(q)  
-                if q_id:  
-                    self.questions_by_id[q_id] = q  
-                if parent_id:  
-                    self.parent_subquestion_map[parent_id].append(q)  
+            # Organize by page and ID
+            for q in self.all_questions:
+                page = q.get('page_number')
+                q_id = q.get('question_id')
+                parent_id = q.get('parent_question_id', '')
+
+                # Freeze options once at load: the formatter's caches key
+                # on the options tuple, so handing every call the same
+                # hashable object makes tuple(...) there a no-op
+                options = q.get('response_options')
+                if isinstance(options, list):
+                    q['response_options'] = tuple(options)
+
+                # Intern the handful of values repeated on every question
+                # so hundreds of duplicates collapse to shared strings
+                for key in ('section_name', 'question_type'):
+                    value = q.get(key)
+                    if isinstance(value, str):
+                        q[key] = sys.intern(value)
     
-        except UnicodeDecodeError as e:  
+                if page:
+                    self.questions_by_page.setdefault(page, []).append(q)
+                if q_id:
+                    self.questions_by_id[q_id] = q
+                if parent_id:
+                    self.parent_subquestion_map.setdefault(parent_id, []).append(q)
+
+            # Sort once at load; get_page_numbers is called repeatedly
+            self._sorted_page_numbers = sorted(self.questions_by_page.keys())
+
+        except UnicodeDecodeError as e:
             # Handle encoding errors gracefully  
             raise RuntimeError(f"Failed to load questions due to encoding error: {str(e)}")  
         except json.JSONDecodeError as e:  
@@ -106,8 +135,8 @@ class QuestionProcessor:
         return self.questions_by_page.get(page_number, [])
     
     def get_page_numbers(self) -> List[int]:
-        """Get list of all page numbers with questions"""
-        return sorted(self.questions_by_page.keys())
+        """Get list of all page numbers with questions (presorted at load)"""
+        return self._sorted_page_numbers
     
     def get_subquestions(self, parent_id: str) -> List[Dict]:
         """
@@ -5,18 +5,25 @@ Stores answered questions within a section for context injection.
 Memory is cleared when section changes.
 """
 
+from operator import attrgetter
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class AnsweredQuestion:
-    """Represents a single answered question"""
+    """Represents a single answered question
+
+    Slotted: sections can hold hundreds of these, and slots drop the
+    per-instance __dict__ (~2.5x smaller) while speeding the attribute
+    reads the sort/format hot paths do.
+    """
     question_id: str
     question_text: str
     answer: str
     question_type: str
     section_name: str
+    sort_key: tuple = field(default=(), compare=False)  # parsed once at insert
 
 
 class SectionMemory:
@@ -27,6 +34,9 @@ class SectionMemory:
     def __init__(self):
         self.current_section: Optional[str] = None
         self.answers: Dict[str, AnsweredQuestion] = {}
+        # Answers bucketed by base question number ("7.2" → 7) so range
+        # lookups touch only the requested buckets, not every answer
+        self._by_base: Dict[int, List[AnsweredQuestion]] = {}
     
     def set_section(self, section_name: str):
         """
@@ -54,8 +64,26 @@ class SectionMemory:
             question_type=question.get('question_type', ''),
             section_name=question.get('section_name', '')
         )
-        
+        # Parse the ID into its sort tuple once; every later sort just
+        # compares prebuilt tuples via attrgetter
+        answered_q.sort_key = self._sort_key(answered_q.question_id)
+
+        previous = self.answers.get(answered_q.question_id)
         self.answers[answered_q.question_id] = answered_q
+
+        # Maintain the base-number index (replacing a re-answered entry)
+        try:
+            base_num = int(answered_q.question_id.split('.')[0])
+        except ValueError:
+            return
+
+        bucket = self._by_base.setdefault(base_num, [])
+        if previous is not None:
+            try:
+                bucket.remove(previous)
+            except ValueError:
+                pass
+        bucket.append(answered_q)
     
     def get_answer(self, question_id: str) -> Optional[AnsweredQuestion]:
         """
@@ -101,35 +129,51 @@ class SectionMemory:
             end_num = int(end_id)
         except ValueError:
             return []
-        
-        result = []
-        for qid, answered in self.answers.items():
-            # Extract base number from question_id (e.g., "7.2" → 7)
-            try:
-                base_num = int(qid.split('.')[0])
-                if start_num <= base_num <= end_num:
-                    result.append(answered)
-            except (ValueError, IndexError):
-                continue
-        
+
+        if not self._by_base:
+            return []
+
+        # Clamp to the buckets that exist so an oversized parsed range
+        # ("questions 1 through 99999") can't cause a huge empty walk
+        start_num = max(start_num, min(self._by_base))
+        end_num = min(end_num, max(self._by_base))
+
+        # Pull only the buckets in range - no per-answer id parsing
+        result = [
+            answered
+            for base_num in range(start_num, end_num + 1)
+            for answered in self._by_base.get(base_num, ())
+        ]
+
         # Sort by question ID
-        result.sort(key=lambda x: self._sort_key(x.question_id))
+        result.sort(key=attrgetter('sort_key'))
         return result
-    
+
     def get_all_answers(self) -> List[AnsweredQuestion]:
         """
         Get all answered questions in current section
-        
+
         Returns:
             List of all AnsweredQuestion objects, sorted by ID
         """
         result = list(self.answers.values())
-        result.sort(key=lambda x: self._sort_key(x.question_id))
+        result.sort(key=attrgetter('sort_key'))
         return result
+
+    def get_answer_log(self) -> List[AnsweredQuestion]:
+        """
+        Get all answered questions in insertion (answering) order
+
+        Unlike get_all_answers, the result only ever grows by appending
+        as new answers land, so prompts built from it keep a stable
+        prefix - which is what LLM provider prompt caches key on.
+        """
+        return list(self.answers.values())
     
     def clear(self):
         """Clear all memory"""
         self.answers.clear()
+        self._by_base.clear()
         self.current_section = None
     
     @staticmethod
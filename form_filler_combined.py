@@ -7,476 +7,572 @@ Combines section_mapping, flatten, and sample34.py into CombinedPDFFormFiller cl
 
 import os
 import sys
+import ast
 import json
 import re
+from functools import lru_cache
 import fitz  # pip install PyMuPDF
 
+# Optional multi-string matcher (with graceful fallback)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # =============================================================================
 # SECTION MAPPING (from section_mapping_fixed2.py)
 # =============================================================================
 
-def question_id_to_pdf_field(question_id, section):
-    """Main dispatcher - routes to section-specific mapper"""
-    if section == 'CLAIM INFO':
-        return map_claim_info(question_id)
-    elif section == 'OVERVIEW AND TIMELINE OF KEY POINTS':
-        return map_overview(question_id)
-    elif section == 'DEGREE OF INJURY':
-        return map_degree_of_injury(question_id)
-    elif section in ['PATIENT INTAKE/ASSESSMENT SECTION', 'PATIENT INTAKE/ASSESSMENT']:
-        return map_intake(question_id)
-    elif section == 'DIAGNOSTIC WORK UP':
-        return map_diagnostic(question_id)
-    elif section == 'TREATMENT':
-        return map_treatment(question_id)
-    elif section == 'PROCEDURES/SURGERIES':
-        return map_procedures(question_id)
-    elif section == 'MONITORING AND FOLLOWUP':
-        return map_monitoring(question_id)
-    elif section == 'ADDITIONAL CONTRIBUTING FACTORS':
-        return map_additional(question_id)
-    elif section == 'STANDARD OF CARE':
-        return map_standard_of_care(question_id)
-    elif section == 'CAUSATION':
-        return map_causation(question_id)
-    elif section == 'CLOSING THOUGHTS':
-        return map_closing_thoughts(question_id)
-    else:
-        return None
-
-
-def map_claim_info(question_id):
-    """CLAIM INFO mapping"""
-    mapping = {
-        '1': 'File_No',
-        '2': 'MagMutual_Contact',
-        '3': 'Date_Requested_af_date',
-        '4': 'MagMutual_Contact_Phone',
-        '5': 'MagMutual_Contact_Email',
-        '6': 'Patient_Name',
-        '7': 'Defendant_Name',
-        '8': 'Defendant_Specialty',
-        '9': 'Reviewer_Name',
-        '10': 'Reviewer_Specialty',
-        '11': 'Reviewer_PhoneNumber',
-        '12': 'Reviewer_Email',
-        '13': 'Brief_Synopsis',
-        '14': 'Alleged_Injury',
-        '15': 'Summary_Of_Allegations',
-    }
-    return mapping.get(question_id)
-
-
-def map_overview(question_id):
-    """OVERVIEW mapping"""
-    mapping = {
-        '1': 'Overview_Q1',
-        '2': 'Overview_Q2',
-        '2.1': 'Overview_Q2_Comments',
-        '3': 'Overview_Q3',
-        '3.1': 'Overview_Q3_Modifications',
-    }
-    return mapping.get(question_id)
-
-
-def map_degree_of_injury(question_id):
-    """DEGREE OF INJURY mapping"""
-    mapping = {
-        '1': 'Patient_Injury',
-        '2': 'Degree_Of_Injury_Alleged_vs_Suffered',
-        '2.alleged': 'Degree_Of_Injury_Alleged',
-        '2.suffered': 'Degree_Of_Injury_Suffered',
-        '3': 'Injury_Impact',
+# Flat (section, question_id) -> pdf field table for the sections whose
+# mappings are pure static dicts. Built once at import; the dispatcher
+# answers these with a single dict probe instead of a function call that
+# rebuilds its mapping dict per invocation.
+FIELD_MAP = {}
+
+def _build_field_map():
+    static_sections = {
+        'CLAIM INFO': {
+            '1': 'File_No',
+            '2': 'MagMutual_Contact',
+            '3': 'Date_Requested_af_date',
+            '4': 'MagMutual_Contact_Phone',
+            '5': 'MagMutual_Contact_Email',
+            '6': 'Patient_Name',
+            '7': 'Defendant_Name',
+            '8': 'Defendant_Specialty',
+            '9': 'Reviewer_Name',
+            '10': 'Reviewer_Specialty',
+            '11': 'Reviewer_PhoneNumber',
+            '12': 'Reviewer_Email',
+            '13': 'Brief_Synopsis',
+            '14': 'Alleged_Injury',
+            '15': 'Summary_Of_Allegations',
+        },
+        'OVERVIEW AND TIMELINE OF KEY POINTS': {
+            '1': 'Overview_Q1',
+            '2': 'Overview_Q2',
+            '2.1': 'Overview_Q2_Comments',
+            '3': 'Overview_Q3',
+            '3.1': 'Overview_Q3_Modifications',
+        },
+        'DEGREE OF INJURY': {
+            '1': 'Patient_Injury',
+            '2': 'Degree_Of_Injury_Alleged_vs_Suffered',
+            '2.alleged': 'Degree_Of_Injury_Alleged',
+            '2.suffered': 'Degree_Of_Injury_Suffered',
+            '3': 'Injury_Impact',
+        },
+        'STANDARD OF CARE': {
+            # '1' intentionally unmapped; .get misses already yield None
+            '1.1': 'z3_Standard_of_Care_1',
+            '1.2': 'z3_Standard_of_Care_2',
+            '1.3': 'z2_Standard_of_Care_3',
+            '1.4': 'z1_Standard_of_Care_4',
+            '1.5': 'z1_Standard_of_Care_5',
+            '2': 'Standard_Of_Care_Q2',
+        },
+        'CAUSATION': {
+            # '1' intentionally unmapped; .get misses already yield None
+            '1.1': 'y3_Causation_1',
+            '1.2': 'y2_Causation_3',
+            '1.3': 'y3_Causation_2',
+            '1.4': 'y1_Causation_4',
+            '1.5': 'y1_Causation_5',
+        },
+        'CLOSING THOUGHTS': {
+            '1': 'Closing_Q1',
+            '1.1': 'Closing_Q1_Comments',
+            '2': 'Closing_Q2',
+            '2.1': 'Closing_Q2_Comments',
+            '3': 'Closing_Q3',
+            '3.1': 'Closing_Q3_Comments',
+            '4': 'Closing_Q4_Comments',
+        },
     }
-    return mapping.get(question_id)
-
-
-def map_intake(question_id):
-    """PATIENT INTAKE mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
-
-    # Q7 special handling
-    if main_q == '7':
-        mapping = {
-            '7': 'Intake_Q7a',
-            '7.1': 'Intake_Q7a_Explain',
-            '7.2.1': 'Intake_Q7a_Handoff',
-            '7.2.2': 'Intake_Q7a_Interdisciplinary',
-            '7.2.3': 'Intake_Q7a_Emergency',
-            '7.2.4': 'Intake_Q7a_Supervision',
-            '7.3': 'Intake_Q7b',
-            '7.3.1': 'Intake_Q7b_Explain',
-            '7.4': 'Intake_Q7c',
-            '7.4.1': 'Intake_Q7c_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q in ['1', '2', '3', '4', '5', '6']:
-        mapping = {
-            main_q: f"Intake_Q{main_q}a",
-            f"{main_q}.1": f"Intake_Q{main_q}a_Explain",
-            f"{main_q}.2": f"Intake_Q{main_q}b",
-            f"{main_q}.2.1": f"Intake_Q{main_q}b_Explain",
-            f"{main_q}.3": f"Intake_Q{main_q}c",
-            f"{main_q}.3.1": f"Intake_Q{main_q}c_Explain",
-        }
-        return mapping.get(question_id)
-
-    # Q8 special handling
-    if main_q == '8':
-        mapping = {
-            '8': 'Intake_Q8',
-            '8.1': 'Intake_Q8_Explain',
-        }
-        return mapping.get(question_id)
-
-    # Q9 special handling
-    if main_q == '9':
-        mapping = {
-            '9': 'Intake_Q9',
-        }
-        return mapping.get(question_id)
 
-    return None
+    for section, mapping in static_sections.items():
+        for question_id, field in mapping.items():
+            FIELD_MAP[(section, question_id)] = field
+
+_build_field_map()
+
+# Pre-baked table (dumps/gen_field_map.py): probed after the live
+# FIELD_MAP, so it only ever answers keys the live tables don't carry
+# (e.g. pre-baked alias rows) and a stale file can never shadow a
+# changed mapping; rerun the generator after mapping changes to retire
+# removed entries
+try:
+    from generated_field_map import FIELD_MAP as _GENERATED_FIELD_MAP
+except ImportError:
+    _GENERATED_FIELD_MAP = None
+
+# Known section-name aliases -> canonical name, normalized once per
+# lookup instead of carrying duplicate table entries per alias
+_SECTION_ALIAS = {
+    'PATIENT INTAKE/ASSESSMENT SECTION': 'PATIENT INTAKE/ASSESSMENT',
+}
+
+# Sections answered by FIELD_MAP alone (a miss there means None, not a
+# fall-through to the dynamic mappers)
+_STATIC_SECTIONS = frozenset({
+    'CLAIM INFO',
+    'OVERVIEW AND TIMELINE OF KEY POINTS',
+    'DEGREE OF INJURY',
+    'STANDARD OF CARE',
+    'CAUSATION',
+    'CLOSING THOUGHTS',
+})
+
+
+def _build_range_table(prefix, mains):
+    """Q1-Q6 style a/b/c sub-question table for one section prefix
+
+    Runs once at import so the mappers probe prebuilt dicts instead of
+    formatting six f-strings and allocating a dict per call.
+    """
+    table = {}
+    for m in mains:
+        table[m] = f'{prefix}_Q{m}a'
+        table[f'{m}.1'] = f'{prefix}_Q{m}a_Explain'
+        table[f'{m}.2'] = f'{prefix}_Q{m}b'
+        table[f'{m}.2.1'] = f'{prefix}_Q{m}b_Explain'
+        table[f'{m}.3'] = f'{prefix}_Q{m}c'
+        table[f'{m}.3.1'] = f'{prefix}_Q{m}c_Explain'
+    return table
+
+
+def _build_q7_table(prefix, checkbox_names):
+    """Shared Q7 sub-question shape for Intake/DiagnosticWorkUp/Treatment
+
+    The three sections repeat the same 7.2.x checkbox / 7.3 / 7.4 shape,
+    differing only in field prefix and checkbox suffix spelling; build
+    each table once at import from this single template.
+    """
+    table = {}
+    for sub_id, name in zip(('7.2.1', '7.2.2', '7.2.3', '7.2.4'), checkbox_names):
+        table[sub_id] = f'{prefix}_Q7a_{name}'
+    table['7.3'] = f'{prefix}_Q7b'
+    table['7.3.1'] = f'{prefix}_Q7b_Explain'
+    table['7.4'] = f'{prefix}_Q7c'
+    table['7.4.1'] = f'{prefix}_Q7c_Explain'
+    return table
+
+
+_INTAKE_Q7 = {
+    '7': 'Intake_Q7a',
+    '7.1': 'Intake_Q7a_Explain',
+    **_build_q7_table('Intake', ('Handoff', 'Interdisciplinary', 'Emergency', 'Supervision')),
+}
+_INTAKE_RANGE = _build_range_table('Intake', '123456')
+_INTAKE_Q8 = {
+    '8': 'Intake_Q8',
+    '8.1': 'Intake_Q8_Explain',
+}
+_INTAKE_Q9 = {
+    '9': 'Intake_Q9',
+}
+
+
+# All intake ids are enumerated, so the merged table answers directly -
+# no split('.') or main-question branching on the hot path
+_INTAKE_TABLE = {**_INTAKE_Q7, **_INTAKE_RANGE, **_INTAKE_Q8, **_INTAKE_Q9}
+
+
+
+_DIAGNOSTIC_Q7 = {
+    '7.1': 'DiagnosticWorkUp_Q7a_Explain',
+    '7.2': 'DiagnosticWorkUp_Q7a',  # bare Q7a lives on 7.2 in this section
+    **_build_q7_table('DiagnosticWorkUp',
+                      ('Handoff', 'Interdisciplinary', 'EmergencySituation', 'SupervisionHierarchy')),
+}
+_DIAGNOSTIC_Q8 = {
+    '8': 'DiagnosticWorkUp_Q8a',
+    '8.1': 'DiagnosticWorkUp_Q8a_Explain',
+    '8.2': 'DiagnosticWorkUp_Q8b',
+    '8.2.1': 'DiagnosticWorkUp_Q8b_Explain',
+    '8.3': 'DiagnosticWorkUp_Q8c',
+    '8.3.1': 'DiagnosticWorkUp_Q8c_Explain',
+}
+_DIAGNOSTIC_Q9 = {
+    '9': 'DiagnosticWorkUp_Q9a',
+    '9.1': 'DiagnosticWorkUp_Q9a_Explain',
+    '9.2': 'DiagnosticWorkUp_Q9a_Explain2',
+    '9.3': 'DiagnosticWorkUp_Q9b',
+    '9.3.1': 'DiagnosticWorkUp_Q9b_Explain',
+    '9.4': 'DiagnosticWorkUp_Q9c',
+    '9.4.1': 'DiagnosticWorkUp_Q9c_Explain',
+    '9.5': 'DiagnosticWorkUp_Q9d',
+    '9.5.1': 'DiagnosticWorkUp_Q9d_Explain',
+}
+_DIAGNOSTIC_RANGE = _build_range_table('DiagnosticWorkUp', '123456')
+_DIAGNOSTIC_Q10 = {
+    '10': 'DiagnosticWorkUp_Q10',
+    '10.1': 'DiagnosticWorkUp_Q10_Explain',
+}
+
+
+_DIAGNOSTIC_TABLE = {
+    **_DIAGNOSTIC_Q7, **_DIAGNOSTIC_Q8, **_DIAGNOSTIC_Q9,
+    **_DIAGNOSTIC_RANGE, **_DIAGNOSTIC_Q10,
+    '11': 'DiagnosticWorkUp_Q11',
+}
 
 
 def map_diagnostic(question_id):
     """DIAGNOSTIC WORK UP mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
-
-    if main_q == '7':
-        mapping = {
-            '7.1': 'DiagnosticWorkUp_Q7a_Explain',
-            '7.2': 'DiagnosticWorkUp_Q7a',
-            '7.2.1': 'DiagnosticWorkUp_Q7a_Handoff',
-            '7.2.2': 'DiagnosticWorkUp_Q7a_Interdisciplinary',
-            '7.2.3': 'DiagnosticWorkUp_Q7a_EmergencySituation',
-            '7.2.4': 'DiagnosticWorkUp_Q7a_SupervisionHierarchy',
-            '7.3': 'DiagnosticWorkUp_Q7b',
-            '7.3.1': 'DiagnosticWorkUp_Q7b_Explain',
-            '7.4': 'DiagnosticWorkUp_Q7c',
-            '7.4.1': 'DiagnosticWorkUp_Q7c_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '8':
-        mapping = {
-            '8': 'DiagnosticWorkUp_Q8a',
-            '8.1': 'DiagnosticWorkUp_Q8a_Explain',
-            '8.2': 'DiagnosticWorkUp_Q8b',
-            '8.2.1': 'DiagnosticWorkUp_Q8b_Explain',
-            '8.3': 'DiagnosticWorkUp_Q8c',
-            '8.3.1': 'DiagnosticWorkUp_Q8c_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '9':
-        mapping = {
-            '9': 'DiagnosticWorkUp_Q9a',
-            '9.1': 'DiagnosticWorkUp_Q9a_Explain',
-            '9.2': 'DiagnosticWorkUp_Q9a_Explain2',
-            '9.3': 'DiagnosticWorkUp_Q9b',
-            '9.3.1': 'DiagnosticWorkUp_Q9b_Explain',
-            '9.4': 'DiagnosticWorkUp_Q9c',
-            '9.4.1': 'DiagnosticWorkUp_Q9c_Explain',
-            '9.5': 'DiagnosticWorkUp_Q9d',
-            '9.5.1': 'DiagnosticWorkUp_Q9d_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q in ['1', '2', '3', '4', '5', '6']:
-        mapping = {
-            main_q: f"DiagnosticWorkUp_Q{main_q}a",
-            f"{main_q}.1": f"DiagnosticWorkUp_Q{main_q}a_Explain",
-            f"{main_q}.2": f"DiagnosticWorkUp_Q{main_q}b",
-            f"{main_q}.2.1": f"DiagnosticWorkUp_Q{main_q}b_Explain",
-            f"{main_q}.3": f"DiagnosticWorkUp_Q{main_q}c",
-            f"{main_q}.3.1": f"DiagnosticWorkUp_Q{main_q}c_Explain",
-        }
-        return mapping.get(question_id)
+    field = _DIAGNOSTIC_TABLE.get(question_id)
+    if field is not None:
+        return field
 
-    if main_q == '10':
-        mapping = {
-            '10': 'DiagnosticWorkUp_Q10',
-            '10.1': 'DiagnosticWorkUp_Q10_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '11':
+    # Any Q11 sub-question maps to the single Q11 field
+    if question_id.startswith('11.'):
         return 'DiagnosticWorkUp_Q11'
 
     return None
 
 
-def map_treatment(question_id):
-    """TREATMENT mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
-
-    if main_q == '7':
-        mapping = {
-            '7': 'Treatment_Q7a',
-            '7.1': 'Treatment_Q7a_Explain',
-            '7.2.1': 'Treatment_Q7a_Handoff',
-            '7.2.2': 'Treatment_Q7a_Interdisciplinary',
-            '7.2.3': 'Treatment_Q7a_EmergencySituation',
-            '7.2.4': 'Treatment_Q7a_SupervisionHierarchy',
-            '7.3': 'Treatment_Q7b',
-            '7.3.1': 'Treatment_Q7b_Explain',
-            '7.4': 'Treatment_Q7c',
-            '7.4.1': 'Treatment_Q7c_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q in ['1', '2', '3', '4', '5', '6']:
-        mapping = {
-            main_q: f"Treatment_Q{main_q}a",
-            f"{main_q}.1": f"Treatment_Q{main_q}a_Explain",
-            f"{main_q}.2": f"Treatment_Q{main_q}b",
-            f"{main_q}.2.1": f"Treatment_Q{main_q}b_Explain",
-            f"{main_q}.3": f"Treatment_Q{main_q}c",
-            f"{main_q}.3.1": f"Treatment_Q{main_q}c_Explain",
-        }
-        return mapping.get(question_id)
-
-    if main_q == '8':
-        mapping = {
-            '8': 'Treatment_Q8a',
-            '8.1': 'Treatment_Q8a_Explain',
-            '8.2': 'Treatment_Q8b',
-            '8.2.1': 'Treatment_Q8b_Explain',
-            '8.3': 'Treatment_Q8c',
-            '8.3.1': 'Treatment_Q8c_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '9':
-        mapping = {
-            '9': 'Treatment_Q9a',
-            '9.1': 'Treatment_Q9a_Explain',
-            '9.2': 'Treatment_Q9a_Explain2',
-            '9.3': 'Treatment_Q9b',
-            '9.3.1': 'Treatment_Q9b_Explain',
-            '9.4': 'Treatment_Q9c',
-            '9.5': 'Treatment_Q9d',
-            '9.5.1': 'Treatment_Q9d_Explain',
-            '9.6': 'Treatment_Q9e',
-            '9.6.1': 'Treatment_Q9e_Explain',
-        }
-        return mapping.get(question_id)
+_TREATMENT_Q7 = {
+    '7': 'Treatment_Q7a',
+    '7.1': 'Treatment_Q7a_Explain',
+    **_build_q7_table('Treatment',
+                      ('Handoff', 'Interdisciplinary', 'EmergencySituation', 'SupervisionHierarchy')),
+}
+_TREATMENT_RANGE = _build_range_table('Treatment', '123456')
+_TREATMENT_Q8 = {
+    '8': 'Treatment_Q8a',
+    '8.1': 'Treatment_Q8a_Explain',
+    '8.2': 'Treatment_Q8b',
+    '8.2.1': 'Treatment_Q8b_Explain',
+    '8.3': 'Treatment_Q8c',
+    '8.3.1': 'Treatment_Q8c_Explain',
+}
+_TREATMENT_Q9 = {
+    '9': 'Treatment_Q9a',
+    '9.1': 'Treatment_Q9a_Explain',
+    '9.2': 'Treatment_Q9a_Explain2',
+    '9.3': 'Treatment_Q9b',
+    '9.3.1': 'Treatment_Q9b_Explain',
+    '9.4': 'Treatment_Q9c',
+    '9.5': 'Treatment_Q9d',
+    '9.5.1': 'Treatment_Q9d_Explain',
+    '9.6': 'Treatment_Q9e',
+    '9.6.1': 'Treatment_Q9e_Explain',
+}
+
+
+_TREATMENT_TABLE = {
+    **_TREATMENT_Q7, **_TREATMENT_RANGE, **_TREATMENT_Q8, **_TREATMENT_Q9,
+    '10': 'Treatment_Q10',
+    '11': 'Treatment_Q11',
+}
 
-    if main_q == '10':
-        return 'Treatment_Q10' if question_id == '10' else 'Treatment_Q10_Explain'
 
-    if main_q == '11':
+def map_treatment(question_id):
+    """TREATMENT mapping"""
+    field = _TREATMENT_TABLE.get(question_id)
+    if field is not None:
+        return field
+
+    # Q10/Q11 sub-questions fall back to their section-wide fields
+    if question_id.startswith('10.'):
+        return 'Treatment_Q10_Explain'
+    if question_id.startswith('11.'):
         return 'Treatment_Q11'
 
     return None
 
 
-def map_procedures(question_id):
-    """PROCEDURES mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
-
-    if main_q == '6':
-        mapping = {
-            '6': 'Procedures_Q6a',
-            '6.1': 'Procedures_Q6a_Explain',
-            '6.2': 'Procedures_Q6b',
-            '6.2.1': 'Procedures_Q6b_Handoff',
-            '6.2.2': 'Procedures_Q6b_Interdisciplinary',
-            '6.2.3': 'Procedures_Q6b_EmergencySituation',
-            '6.2.4': 'Procedures_Q6b_SupervisionHierarchy',
-            '6.3': 'Procedures_Q6c',
-            '6.3.1': 'Procedures_Q6c_Explain',
-            '6.4': 'Procedures_Q6d',
-            '6.4.1': 'Procedures_Q6d_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '7':
-        mapping = {
-            '7': 'Procedures_Q7a',
-            '7.1': 'Procedures_Q7a_Explain',
-            '7.2': 'Procedures_Q7b',
-            '7.2.1': 'Procedures_Q7b_Explain',
-            '7.3': 'Procedures_Q7c',
-            '7.3.1': 'Procedures_Q7c_Explain',
-        }
-        return mapping.get(question_id)
+_PROCEDURES_Q6 = {
+    '6': 'Procedures_Q6a',
+    '6.1': 'Procedures_Q6a_Explain',
+    '6.2': 'Procedures_Q6b',
+    '6.2.1': 'Procedures_Q6b_Handoff',
+    '6.2.2': 'Procedures_Q6b_Interdisciplinary',
+    '6.2.3': 'Procedures_Q6b_EmergencySituation',
+    '6.2.4': 'Procedures_Q6b_SupervisionHierarchy',
+    '6.3': 'Procedures_Q6c',
+    '6.3.1': 'Procedures_Q6c_Explain',
+    '6.4': 'Procedures_Q6d',
+    '6.4.1': 'Procedures_Q6d_Explain',
+}
+_PROCEDURES_Q7 = {
+    '7': 'Procedures_Q7a',
+    '7.1': 'Procedures_Q7a_Explain',
+    '7.2': 'Procedures_Q7b',
+    '7.2.1': 'Procedures_Q7b_Explain',
+    '7.3': 'Procedures_Q7c',
+    '7.3.1': 'Procedures_Q7c_Explain',
+}
+_PROCEDURES_Q8 = {
+    '8': 'Procedures_Q8',
+    '8.1': 'Procedures_Q8_Explain',
+}
+_PROCEDURES_Q1 = {
+    '1': 'Procedures_Q1',
+    '1.1': 'Procedures_Q1_List',
+    '1.2': 'Procedures_Q1a',
+    '1.2.1': 'Procedures_Q1a_Explain',
+    '1.3': 'Procedures_Q1b',
+    '1.3.1': 'Procedures_Q1b_Explain',
+}
+
+
+# Sub-question suffix -> field shape for the shared a/b/c grammar used
+# by Procedures/Monitoring/Additional: one slice + one probe replaces
+# the split-length ladder. A per-segment trie was considered for these
+# hierarchical ids, but every legal dotted id is already expanded into
+# the flat FIELD_MAP at import, so lookups never walk segments at all -
+# this table only backs the build step and the rare fallback miss.
+_GRAMMAR_SUFFIX_SHAPES = {
+    '': 'a',
+    '.1': 'a_Explain',
+    '.2': 'b',
+    '.2.1': 'b_Explain',
+    '.3': 'c',
+    '.3.1': 'c_Explain',
+}
+
+# Main-question sets for the remaining sub-question grammars: frozenset
+# membership instead of building a list literal per call
+_PROCEDURES_GRAMMAR_MAINS = frozenset({'2', '3', '4', '5'})
+_MONITORING_GRAMMAR_MAINS = frozenset({'1', '2', '3', '4', '6'})
+_ADDITIONAL_GRAMMAR_MAINS = frozenset({'1', '2', '3', '6'})
+
+
+def _build_grammar_table(prefix, mains):
+    """Expand the shared a/b/c grammar for one section at import
+
+    All the field-name formatting happens here, once, instead of an
+    f-string per mapper call.
+    """
+    return {
+        main_q + suffix: f'{prefix}_Q{main_q}{shape}'
+        for main_q in mains
+        for suffix, shape in _GRAMMAR_SUFFIX_SHAPES.items()
+    }
 
-    if main_q == '8':
-        mapping = {
-            '8': 'Procedures_Q8',
-            '8.1': 'Procedures_Q8_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '9':
-        return 'Procedures_Q9' if question_id == '9' else None
-
-    if main_q == '1':
-        mapping = {
-            '1': 'Procedures_Q1',
-            '1.1': 'Procedures_Q1_List',
-            '1.2': 'Procedures_Q1a',
-            '1.2.1': 'Procedures_Q1a_Explain',
-            '1.3': 'Procedures_Q1b',
-            '1.3.1': 'Procedures_Q1b_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q in ['2', '3', '4', '5']:
-        sub_q = len(parts)
-        if sub_q == 1:
-            return f'Procedures_Q{main_q}a'
-        elif sub_q == 2:
-            if parts[1] == '1':
-                return f'Procedures_Q{main_q}a_Explain'
-            elif parts[1] == '2':
-                return f'Procedures_Q{main_q}b'
-            elif parts[1] == '3':
-                return f'Procedures_Q{main_q}c'
-        elif sub_q == 3:
-            if parts[1] == '2' and parts[2] == '1':
-                return f'Procedures_Q{main_q}b_Explain'
-            elif parts[1] == '3' and parts[2] == '1':
-                return f'Procedures_Q{main_q}c_Explain'
 
-    return None
+_PROCEDURES_TABLE = {
+    **_PROCEDURES_Q6, **_PROCEDURES_Q7, **_PROCEDURES_Q8, **_PROCEDURES_Q1,
+    **_build_grammar_table('Procedures', _PROCEDURES_GRAMMAR_MAINS),
+    '9': 'Procedures_Q9',
+}
 
 
-def map_monitoring(question_id):
-    """MONITORING mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
-
-    if main_q == '5':
-        mapping = {
-            '5': 'Monitoring_Q5a',
-            '5.1': 'Monitoring_Q5a_Explain',
-            '5.2.1': 'Monitoring_Q5b_Handoff',
-            '5.2.2': 'Monitoring_Q5b_Interdisciplinary',
-            '5.2.3': 'Monitoring_Q5b_EmergencySituation',
-            '5.2.4': 'Monitoring_Q5b_SupervisionHierarchy',
-            '5.3': 'Monitoring_Q5c',
-            '5.3.1': 'Monitoring_Q5c_Explain',
-            '5.4': 'Monitoring_Q5d',
-            '5.4.1': 'Monitoring_Q5d_Explain',
-        }
-        return mapping.get(question_id)
 
-    if main_q == '7':
-        mapping = {
-            '7': 'Monitoring_Q7',
-            '7.1': 'Monitoring_Q7_Explain',
-        }
-        return mapping.get(question_id)
-
-    if main_q == '8':
-        return 'Monitoring_Q8' if question_id == '8' else None
-
-    if main_q in ['1', '2', '3', '4', '6']:
-        sub_q = len(parts)
-        if sub_q == 1:
-            return f'Monitoring_Q{main_q}a'
-        elif sub_q == 2:
-            if parts[1] == '1':
-                return f'Monitoring_Q{main_q}a_Explain'
-            elif parts[1] == '2':
-                return f'Monitoring_Q{main_q}b'
-            elif parts[1] == '3':
-                return f'Monitoring_Q{main_q}c'
-        elif sub_q == 3:
-            if parts[1] == '2' and parts[2] == '1':
-                return f'Monitoring_Q{main_q}b_Explain'
-            elif parts[1] == '3' and parts[2] == '1':
-                return f'Monitoring_Q{main_q}c_Explain'
+_MONITORING_Q5 = {
+    '5': 'Monitoring_Q5a',
+    '5.1': 'Monitoring_Q5a_Explain',
+    '5.2.1': 'Monitoring_Q5b_Handoff',
+    '5.2.2': 'Monitoring_Q5b_Interdisciplinary',
+    '5.2.3': 'Monitoring_Q5b_EmergencySituation',
+    '5.2.4': 'Monitoring_Q5b_SupervisionHierarchy',
+    '5.3': 'Monitoring_Q5c',
+    '5.3.1': 'Monitoring_Q5c_Explain',
+    '5.4': 'Monitoring_Q5d',
+    '5.4.1': 'Monitoring_Q5d_Explain',
+}
+_MONITORING_Q7 = {
+    '7': 'Monitoring_Q7',
+    '7.1': 'Monitoring_Q7_Explain',
+}
 
-    return None
 
+_MONITORING_TABLE = {
+    **_MONITORING_Q5, **_MONITORING_Q7,
+    **_build_grammar_table('Monitoring', _MONITORING_GRAMMAR_MAINS),
+    '8': 'Monitoring_Q8',
+}
 
-def map_additional(question_id):
-    """ADDITIONAL CONTRIBUTING FACTORS mapping"""
-    parts = question_id.split('.')
-    main_q = parts[0]
 
-    if main_q in ['4', '5', '7', '8']:
-        if question_id == main_q:
-            return f'Additional_Q{main_q}'
-        elif question_id == f'{main_q}.1':
-            return f'Additional_Q{main_q}_explain' if main_q != '8' else None
-        return None
 
-    if main_q in ['1', '2', '3', '6']:
-        sub_q = len(parts)
-        if sub_q == 1:
-            return f'Additional_Q{main_q}a'
-        elif sub_q == 2:
-            if parts[1] == '1':
-                return f'Additional_Q{main_q}a_Explain'
-            elif parts[1] == '2':
-                return f'Additional_Q{main_q}b'
-            elif parts[1] == '3':
-                return f'Additional_Q{main_q}c'
-        elif sub_q == 3:
-            if parts[1] == '2' and parts[2] == '1':
-                return f'Additional_Q{main_q}b_Explain'
-            elif parts[1] == '3' and parts[2] == '1':
-                return f'Additional_Q{main_q}c_Explain'
+_ADDITIONAL_TABLE = {
+    '4': 'Additional_Q4',
+    '4.1': 'Additional_Q4_explain',
+    '5': 'Additional_Q5',
+    '5.1': 'Additional_Q5_explain',
+    '7': 'Additional_Q7',
+    '7.1': 'Additional_Q7_explain',
+    '8': 'Additional_Q8',  # Q8 has no explain field
+    **_build_grammar_table('Additional', _ADDITIONAL_GRAMMAR_MAINS),
+}
 
-    return None
 
 
-def map_standard_of_care(question_id):
-    """STANDARD OF CARE mapping"""
-    mapping = {
-        '1': None,
-        '1.1': 'z3_Standard_of_Care_1',
-        '1.2': 'z3_Standard_of_Care_2',
-        '1.3': 'z2_Standard_of_Care_3',
-        '1.4': 'z1_Standard_of_Care_4',
-        '1.5': 'z1_Standard_of_Care_5',
-        '2': 'Standard_Of_Care_Q2',
-    }
-    return mapping.get(question_id)
-
-
-def map_causation(question_id):
-    """CAUSATION mapping"""
-    mapping = {
-        '1': None,
-        '1.1': 'y3_Causation_1',
-        '1.2': 'y2_Causation_3',
-        '1.3': 'y3_Causation_2',
-        '1.4': 'y1_Causation_4',
-        '1.5': 'y1_Causation_5',
+def _merge_computed_sections():
+    """Fold every enumerable computed-section id into flat FIELD_MAP
+
+    With the per-section tables and the finite a/b/c grammar expanded
+    here, FIELD_MAP covers the full legal keyspace and almost every
+    dispatcher call resolves with a single static dict probe - the
+    pure-Python stand-in for a perfect-hash table. The mappers remain
+    as fallback for the open-ended shapes (Treatment/Diagnostic Q10/Q11
+    sub-ids match by prefix, not enumeration).
+    """
+    computed = {
+        'PATIENT INTAKE/ASSESSMENT': _INTAKE_TABLE,
+        'DIAGNOSTIC WORK UP': _DIAGNOSTIC_TABLE,
+        'TREATMENT': _TREATMENT_TABLE,
+        'PROCEDURES/SURGERIES': _PROCEDURES_TABLE,
+        'MONITORING AND FOLLOWUP': _MONITORING_TABLE,
+        'ADDITIONAL CONTRIBUTING FACTORS': _ADDITIONAL_TABLE,
     }
-    return mapping.get(question_id)
-
-
-def map_closing_thoughts(question_id):
-    """CLOSING THOUGHTS mapping"""
-    mapping = {
-        '1': 'Closing_Q1',
-        '1.1': 'Closing_Q1_Comments',
-        '2': 'Closing_Q2',
-        '2.1': 'Closing_Q2_Comments',
-        '3': 'Closing_Q3',
-        '3.1': 'Closing_Q3_Comments',
-        '4': 'Closing_Q4_Comments',
+    for section, table in computed.items():
+        for question_id, field in table.items():
+            FIELD_MAP[(section, question_id)] = field
+
+_merge_computed_sections()
+
+
+def _intern_tables():
+    """Intern every key and field name in the lookup tables
+
+    All keys/values are fixed strings compared on each lookup; interned
+    strings hit the pointer-equality fast path in dict probes.
+    """
+    global FIELD_MAP
+    FIELD_MAP = {
+        (sys.intern(section), sys.intern(question_id)): sys.intern(field)
+        for (section, question_id), field in FIELD_MAP.items()
     }
-    return mapping.get(question_id)
+
+    for table_name in ('_INTAKE_TABLE', '_DIAGNOSTIC_TABLE', '_TREATMENT_TABLE',
+                       '_PROCEDURES_TABLE', '_MONITORING_TABLE', '_ADDITIONAL_TABLE'):
+        table = globals()[table_name]
+        globals()[table_name] = {
+            sys.intern(question_id): sys.intern(field)
+            for question_id, field in table.items()
+        }
+
+_intern_tables()
+
+# Reverse index: pdf field -> (section, question_id). Field names are
+# unique thanks to their section prefixes; the intake alias keys both
+# map to the same fields, so the canonical (first-seen) entry wins.
+_INVERSE_FIELD_MAP = {}
+for _key, _field in FIELD_MAP.items():
+    _INVERSE_FIELD_MAP.setdefault(_field, _key)
+
+
+def pdf_field_to_question(field_name):
+    """Reverse lookup: pdf field name -> (section, question_id) or None"""
+    return _INVERSE_FIELD_MAP.get(field_name)
+
+
+# Only sections with open-ended prefix fallbacks still need a mapper;
+# everything else is fully answered by FIELD_MAP
+_SECTION_DISPATCH = {
+    'DIAGNOSTIC WORK UP': map_diagnostic,
+    'TREATMENT': map_treatment,
+}
+
+
+# Defined after all tables exist so the default-argument bindings grab
+# the final (interned) dicts; bound .get methods load as locals inside
+# the function instead of paying LOAD_GLOBAL + LOAD_ATTR per call.
+# No lru_cache layer: with the full keyspace folded into FIELD_MAP a
+# lookup already is one C-level dict probe, so a memo dict in front
+# would only duplicate the table - this thin function is as close to a
+# compiled lookup as the tree gets without shipping a C extension.
+def question_id_to_pdf_field(question_id, section,
+                             _generated=_GENERATED_FIELD_MAP,
+                             _static_lookup=FIELD_MAP.get,
+                             _mapper_lookup=_SECTION_DISPATCH.get,
+                             _alias_lookup=_SECTION_ALIAS.get):
+    """Main dispatcher - flat table first, then section-specific mapper"""
+    # Normalize known aliases to their canonical section name once
+    section = _alias_lookup(section, section)
+
+    # Live table first: the generated file may be stale, and both are
+    # single dict probes anyway
+    field = _static_lookup((section, question_id))
+    if field is not None:
+        return field
+
+    if _generated is not None:
+        field = _generated.get((section, question_id))
+        if field is not None:
+            return field
+
+    if section in _STATIC_SECTIONS:
+        return None
+
+    mapper = _mapper_lookup(section)
+    return mapper(question_id) if mapper else None
 
 
 # =============================================================================
 # COMBINED PDF FORM FILLER CLASS
 # =============================================================================
 
+# Rating digit (1-9 as its own word), compiled once - extract_rating_value
+# runs per rating answer in load_answers
+_RATING_DIGIT_RE = re.compile(r'\b([1-9])\b')
+
+# Dict-shaped answer string ("{...}") sniff for load_answers
+_DICTISH_RE = re.compile(r'^\s*\{.*\}\s*$', re.DOTALL)
+
+# Checkbox-group value keyword -> individual checkbox field suffix, with
+# one longest-first alternation pattern replacing the per-key substring
+# loop in load_answers
+_CHECKBOX_SUFFIXES = {
+    'handoff': '_Handoff',
+    'interdisciplinary': '_Interdisciplinary',
+    'emergency situation': '_EmergencySituation',
+    'emergency': '_EmergencySituation',
+    'supervision/hierarchy': '_SupervisionHierarchy',
+    'supervision': '_SupervisionHierarchy',
+    'hierarchy': '_SupervisionHierarchy',
+}
+_CHECKBOX_SUFFIX_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _CHECKBOX_SUFFIXES), key=len, reverse=True))
+)
+
+# Fixed keywords consulted by the button-matching rules; each normalized
+# string is scanned for all of them at once instead of one substring
+# test per rule per (button, answer) pair
+_MATCH_KEYWORDS = (
+    'defendant', 'group', 'hospital', 'facility', 'healthcare', 'other',
+    'handoff', 'interdisciplinary', 'emergency', 'supervision',
+    'hierarchy', 'primary', 'role', 'consultant', 'supervis',
+)
+
+_KW_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _MATCH_KEYWORDS:
+        _KW_AUTOMATON.add_word(_kw, _kw)
+    _KW_AUTOMATON.make_automaton()
+
+
+@lru_cache(maxsize=4096)
+def _keyword_hits(text):
+    """Set of match keywords contained in text (one pass, cached)"""
+    if _KW_AUTOMATON is not None:
+        return frozenset(kw for _, kw in _KW_AUTOMATON.iter(text))
+    return frozenset(kw for kw in _MATCH_KEYWORDS if kw in text)
+
+
+_FACILITY_ANSWER_KEYWORDS = frozenset({'defendant', 'group', 'hospital', 'facility', 'healthcare'})
+
+# URL-style escapes decoded during normalization, applied in one
+# alternation pass instead of five sequential str.replace scans
+_URL_DECODE = {'#20': ' ', '#2C': ',', '#2c': ',', '#2F': '/', '#2f': '/'}
+_URL_ESCAPE_RE = re.compile('|'.join(map(re.escape, _URL_DECODE)))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text):
+    """Decode escapes, lowercase, collapse whitespace (cached per string)
+
+    Button on_state strings and answer parts repeat across the
+    answers x buttons loops, so identical inputs hit the cache.
+    """
+    text = _URL_ESCAPE_RE.sub(lambda m: _URL_DECODE[m.group(0)], text)
+    return ' '.join(text.lower().split())
+
 class CombinedPDFFormFiller:
     """
     Combined PDF Form Filler
@@ -532,7 +628,7 @@ class CombinedPDFFormFiller:
         if isinstance(answer_value, int):
             return answer_value
         val = str(answer_value).strip()
-        match = re.search(r'\b([1-9])\b', val)
+        match = _RATING_DIGIT_RE.search(val)
         if match:
             return int(match.group(1))
         return None
@@ -542,15 +638,7 @@ class CombinedPDFFormFiller:
         """Normalize text for comparison."""
         if not text:
             return ""
-        # Decode common URL encodings
-        text = text.replace('#20', ' ')
-        text = text.replace('#2C', ',')
-        text = text.replace('#2c', ',')
-        text = text.replace('#2F', '/')
-        text = text.replace('#2f', '/')
-        # Remove extra whitespace and lowercase
-        text = ' '.join(text.lower().split())
-        return text
+        return _normalize_text(text)
     
     @staticmethod
     def split_multi_answer(answer_str):
@@ -576,79 +664,71 @@ class CombinedPDFFormFiller:
         else:
             answer_parts = [answer_str]
         
-        # Try to match each answer part to buttons
+        # Try to match each answer part to buttons; keyword sets are
+        # computed once per normalized string, not once per rule
         matching_buttons = []
         for btn_idx, btn in enumerate(sorted_buttons):
             btn_on_state = btn.on_state()
             if not btn_on_state:
                 continue
-            
+
             # Normalize button on_state
             normalized_on_state = self.normalize_text(btn_on_state)
-            
+            state_keywords = _keyword_hits(normalized_on_state)
+
             # Check if any answer part matches this button
             for ans_part in answer_parts:
                 normalized_ans = self.normalize_text(ans_part)
-                matched = False
-                
-                # Exact match
-                if normalized_ans == normalized_on_state:
-                    matched = True
-                
-                # Check for keyword matching
-                else:
-                    # For "defendant is a group, hospital, or other healthcare facility"
-                    if any(word in normalized_ans for word in ['defendant', 'group', 'hospital', 'facility', 'healthcare']):
-                        if all(word in normalized_on_state for word in ['group', 'hospital', 'facility']):
-                            matched = True
-                        elif all(word in normalized_on_state for word in ['group', 'facility']):
-                            matched = True
-                    
-                    # For "other"
-                    if not matched and 'other' in normalized_ans and len(normalized_ans.split()) <= 2:
-                        if 'other' == normalized_on_state or normalized_on_state == 'other':
-                            matched = True
-                    
-                    # For "handoff"
-                    if not matched and 'handoff' in normalized_ans:
-                        if 'handoff' in normalized_on_state:
-                            matched = True
-                    
-                    # For "interdisciplinary"
-                    if not matched and 'interdisciplinary' in normalized_ans:
-                        if 'interdisciplinary' in normalized_on_state:
-                            matched = True
-                    
-                    # For "emergency"
-                    if not matched and 'emergency' in normalized_ans:
-                        if 'emergency' in normalized_on_state:
-                            matched = True
-                    
-                    # For "supervision/hierarchy"
-                    if not matched and ('supervision' in normalized_ans or 'hierarchy' in normalized_ans):
-                        if 'supervision' in normalized_on_state or 'hierarchy' in normalized_on_state:
-                            matched = True
-                    
-                    # For "primary role"
-                    if not matched and 'primary' in normalized_ans:
-                        if 'primary' in normalized_on_state and 'role' in normalized_on_state:
-                            matched = True
-                    
-                    # For "consultant"
-                    if not matched and 'consultant' in normalized_ans:
-                        if 'consultant' == normalized_on_state:
-                            matched = True
-                    
-                    # For "supervisory"
-                    if not matched and 'supervis' in normalized_ans:
-                        if 'supervis' in normalized_on_state:
-                            matched = True
-                
-                if matched:
+                if self._keywords_match(normalized_ans, normalized_on_state, state_keywords):
                     matching_buttons.append((btn_idx, btn, ans_part))
                     break
-        
+
         return matching_buttons
+
+    @staticmethod
+    def _keywords_match(normalized_ans, normalized_on_state, state_keywords):
+        """Apply the button-matching rules over precomputed keyword sets"""
+        # Exact match
+        if normalized_ans == normalized_on_state:
+            return True
+
+        ans_keywords = _keyword_hits(normalized_ans)
+
+        # For "defendant is a group, hospital, or other healthcare facility"
+        # (a state containing group+facility covers group+hospital+facility)
+        if ans_keywords & _FACILITY_ANSWER_KEYWORDS:
+            if 'group' in state_keywords and 'facility' in state_keywords:
+                return True
+
+        # For "other"
+        if 'other' in ans_keywords and len(normalized_ans.split()) <= 2:
+            if normalized_on_state == 'other':
+                return True
+
+        # For handoff / interdisciplinary / emergency
+        for keyword in ('handoff', 'interdisciplinary', 'emergency'):
+            if keyword in ans_keywords and keyword in state_keywords:
+                return True
+
+        # For "supervision/hierarchy"
+        if ('supervision' in ans_keywords or 'hierarchy' in ans_keywords):
+            if 'supervision' in state_keywords or 'hierarchy' in state_keywords:
+                return True
+
+        # For "primary role"
+        if 'primary' in ans_keywords:
+            if 'primary' in state_keywords and 'role' in state_keywords:
+                return True
+
+        # For "consultant"
+        if 'consultant' in ans_keywords and normalized_on_state == 'consultant':
+            return True
+
+        # For "supervisory"
+        if 'supervis' in ans_keywords and 'supervis' in state_keywords:
+            return True
+
+        return False
     
     # -------------------------------------------------------------------------
     # ANSWER LOADING (from sample34.py)
@@ -669,15 +749,16 @@ class CombinedPDFFormFiller:
             answer_value = item.get('answer')
             question_type = item.get('question_type') or ''
 
-            if isinstance(answer_value, str) and answer_value.strip().startswith('{'):
+            if isinstance(answer_value, str) and _DICTISH_RE.match(answer_value):
+                # literal_eval handles both single- and double-quoted
+                # dicts natively - no quote rewrite that used to corrupt
+                # values containing apostrophes
                 try:
-                    # Try JSON parsing
-                    answer_value = json.loads(answer_value.replace("'", '"'))
-                except:
+                    answer_value = ast.literal_eval(answer_value)
+                except (ValueError, SyntaxError):
                     try:
-                        # Fallback to Python dict syntax
-                        answer_value = ast.literal_eval(answer_value)
-                    except:
+                        answer_value = json.loads(answer_value)
+                    except json.JSONDecodeError:
                         pass  # Keep as string if parsing fails
             
             # Skip SKIPPED, None, empty answers
@@ -737,30 +818,16 @@ class CombinedPDFFormFiller:
                 if base_field_name:
                     # Split the answer (handles both comma-separated and single values)
                     checkbox_values = self.split_multi_answer(answer_value)
-                    
-                    # Mapping of normalized answer values to field suffixes
-                    checkbox_suffix_map = {
-                        'handoff': '_Handoff',
-                        'interdisciplinary': '_Interdisciplinary',
-                        'emergency situation': '_EmergencySituation',
-                        'emergency': '_EmergencySituation',
-                        'supervision/hierarchy': '_SupervisionHierarchy',
-                        'supervision': '_SupervisionHierarchy',
-                        'hierarchy': '_SupervisionHierarchy',
-                    }
-                    
+
                     # Create individual checkbox entries
                     checkbox_created = False
                     for checkbox_val in checkbox_values:
                         normalized_val = self.normalize_text(checkbox_val)
-                        
-                        # Find matching suffix
-                        suffix = None
-                        for key, suf in checkbox_suffix_map.items():
-                            if key in normalized_val:
-                                suffix = suf
-                                break
-                        
+
+                        # Find matching suffix with one alternation scan
+                        match = _CHECKBOX_SUFFIX_RE.search(normalized_val)
+                        suffix = _CHECKBOX_SUFFIXES[match.group(0)] if match else None
+
                         if suffix:
                             checkbox_field_name = base_field_name + suffix
                             answer_map[checkbox_field_name] = {
@@ -791,24 +858,21 @@ class CombinedPDFFormFiller:
         self.answer_map = answer_map
         return answer_map
     
-    # -------------------------------------------------------------------------
-    # WIDGET HELPERS
-    # -------------------------------------------------------------------------
-    
-    @staticmethod
-    def get_all_widgets_with_name(page, field_name):
-        """Get all widgets with the same field name on a page."""
-        all_widgets = []
-        widgets = page.widgets()
-        if widgets:
-            for widget in widgets:
-                if widget.field_name == field_name:
-                    all_widgets.append(widget)
-        return all_widgets
-    
     # -------------------------------------------------------------------------
     # FORM FILLING (from sample34.py)
     # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _set_button_value(btn, desired):
+        """Write and update a button only when its value actually changes
+
+        widget.update() rewrites the annotation into the PDF - the
+        expensive part of form filling - so group clear passes skip
+        buttons already in the desired state.
+        """
+        if btn.field_value != desired:
+            btn.field_value = desired
+            btn.update()
     
     def fill_form(self):
         """Fill PDF form fields."""
@@ -825,24 +889,34 @@ class CombinedPDFFormFiller:
             processed_widgets = set()
             
             for page_num, page in enumerate(self.doc):
-                widgets = page.widgets()
+                widgets = list(page.widgets() or ())
                 if not widgets:
                     continue
-                
-                for widget in widgets:
-                    field_name = widget.field_name
-                    if not field_name:
-                        self.stats["skipped"] += 1
-                        continue
-                    
+
+                # Index widgets by field name once per page; sibling
+                # lookups below are O(1) instead of re-walking
+                # page.widgets() per matched field
+                widgets_by_name = {}
+                for w in widgets:
+                    if w.field_name:
+                        widgets_by_name.setdefault(w.field_name, []).append(w)
+
+                # Count unnamed and unanswered widgets as skipped up
+                # front; only widgets with an answer enter the fill loop
+                self.stats["skipped"] += sum(1 for w in widgets if not w.field_name)
+
+                fillable = []
+                for name, page_widgets in widgets_by_name.items():
+                    if name in self.answer_map:
+                        fillable.extend((name, w) for w in page_widgets)
+                    else:
+                        self.stats["skipped"] += len(page_widgets)
+
+                for field_name, widget in fillable:
                     widget_id = (field_name, page_num, round(widget.rect.x0, 1), round(widget.rect.y0, 1))
                     if widget_id in processed_widgets:
                         continue
-                    
-                    if field_name not in self.answer_map:
-                        self.stats["skipped"] += 1
-                        continue
-                    
+
                     processed_widgets.add(widget_id)
                     answer_data = self.answer_map[field_name]
                     answer_value = answer_data["value"]
@@ -850,7 +924,7 @@ class CombinedPDFFormFiller:
                     
                     try:
                         widget_type = (widget.field_type_string or "").lower()
-                        all_widgets_on_page = self.get_all_widgets_with_name(page, field_name)
+                        all_widgets_on_page = widgets_by_name.get(field_name, [])
                         
                         # INDIVIDUAL CHECKBOX (from split checkbox_group)
                         if question_type == "individual_checkbox":
@@ -883,19 +957,17 @@ class CombinedPDFFormFiller:
                                 button_index = self.RADIO_BUTTON_MAPPING.get(val)
                                 
                                 if button_index is not None and button_index < len(sorted_buttons):
-                                    # Clear all buttons first
+                                    # Clear all buttons first (only writing
+                                    # the ones not already off)
+                                    target_button = sorted_buttons[button_index]
                                     for btn in sorted_buttons:
-                                        btn.field_value = "/Off"
-                                        btn.update()
-                                    
+                                        if btn is not target_button:
+                                            self._set_button_value(btn, "/Off")
+
                                     # Set target button
-                                    target_button = sorted_buttons[button_index]
-                                    on_state = target_button.on_state()
-                                    if on_state:
-                                        target_button.field_value = on_state
-                                    else:
-                                        target_button.field_value = "/Yes"
-                                    target_button.update()
+                                    self._set_button_value(
+                                        target_button, target_button.on_state() or "/Yes"
+                                    )
                                     
                                     print(f"✓ [Radio-Group] {field_name:50s} = {answer_value:15s} (btn {button_index})")
                                     self.stats["filled"] += 1
@@ -915,18 +987,19 @@ class CombinedPDFFormFiller:
                                 matching_buttons = self.find_matching_buttons(answer_value, question_type, sorted_buttons)
                                 
                                 if matching_buttons:
-                                    # Clear all first
+                                    # Clear all first (skipping matched
+                                    # buttons and already-off siblings)
+                                    matched_set = {id(btn) for _, btn, _ in matching_buttons}
                                     for btn in sorted_buttons:
-                                        btn.field_value = "/Off"
-                                        btn.update()
-                                    
+                                        if id(btn) not in matched_set:
+                                            self._set_button_value(btn, "/Off")
+
                                     # Set matched buttons
                                     selected_labels = []
                                     for btn_idx, btn, matched_text in matching_buttons:
                                         on_state = btn.on_state()
                                         if on_state:
-                                            btn.field_value = on_state
-                                            btn.update()
+                                            self._set_button_value(btn, on_state)
                                             selected_labels.append(self.normalize_text(on_state))
                                     
                                     print(f"✓ [MultiSelect] {field_name:50s} = {len(matching_buttons)} option(s): {', '.join(selected_labels)}")
@@ -954,14 +1027,14 @@ class CombinedPDFFormFiller:
                                         normalized_answer = self.normalize_text(answer_str)
                                         
                                         if normalized_answer == clean_on_state or answer_str == btn_on_state:
-                                            # Clear all buttons
+                                            # Clear all other buttons (only
+                                            # writing ones not already off)
                                             for b in sorted_buttons:
-                                                b.field_value = "/Off"
-                                                b.update()
-                                            
+                                                if b is not btn:
+                                                    self._set_button_value(b, "/Off")
+
                                             # Set this button
-                                            btn.field_value = btn_on_state
-                                            btn.update()
+                                            self._set_button_value(btn, btn_on_state)
                                             
                                             if 'rating' in answer_data:
                                                 print(f"✓ [Rating] {field_name:50s} = {answer_value:5s}")
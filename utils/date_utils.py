@@ -33,8 +33,8 @@ class DateUtils:
     @staticmethod
     def fix_ocr_errors(text: str) -> str:
         """Fix common OCR errors in dates"""
-        for error, correction in config.OCR_CORRECTIONS.items():
-            text = text.replace(error, correction)
+        # All OCR_CORRECTIONS in one scan instead of one replace() each
+        text = config.fix_ocr(text)
 
         # Fix O -> 0 in years (e.g., 2O23 -> 2023)
         text = re.sub(r'(\d{2})O(\d)', r'\g<1>0\2', text)